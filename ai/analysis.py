@@ -0,0 +1,247 @@
+"""
+Service d'analyse de positions : évaluation, meilleur coup et variante
+principale (PV) calculés par MinimaxBot (recherche PVS).
+
+Bibliothèque :
+    from ai.analysis import Analyzer
+    Analyzer(db_path="analyses.sqlite").analyze(fen, depth=6)
+
+Ligne de commande / HTTP :
+    python -m ai.analysis "B:W21-32:B1-12" --depth 6
+    python -m ai.analysis --serve 8766 --db analyses.sqlite
+    GET http://127.0.0.1:8766/analyze?fen=...&depth=6  (ou &time=1.5)
+
+Les résultats sont gardés dans un cache LRU indexé par (position, profondeur),
+éventuellement persisté dans SQLite. Chaque résultat note le temps qu'il a
+coûté ("budget" : temps limite, ou durée de la recherche à profondeur fixe).
+Une demande à temps limité est servie par la recherche la plus profonde déjà
+connue pour la position seulement si son budget couvre le temps demandé ;
+sinon la position est recherchée à nouveau et le cache mis à jour.
+"""
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from game.notation import parse_fen, to_fen, move_to_text
+from ai.minimax_bot import (MinimaxBot, any_capture_exists, apply_single_step,
+                            clone_board, opponent)
+
+DEFAULT_DEPTH = 6
+MAX_DEPTH     = 64   # plafond de la profondeur demandée et de l'approfondissement
+
+
+class AnalysisCache:
+    """LRU en mémoire (position, profondeur) → résultat, avec SQLite optionnel."""
+
+    def __init__(self, maxsize: int = 4096, db_path: Optional[str] = None):
+        self.maxsize = maxsize
+        self._lru: "OrderedDict[Tuple[str, int], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                " fen TEXT NOT NULL, depth INTEGER NOT NULL, result TEXT NOT NULL,"
+                " PRIMARY KEY (fen, depth))")
+            self._db.commit()
+
+    def _remember(self, key: Tuple[str, int], result: dict) -> None:
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def get(self, fen: str, depth: Optional[int]) -> Optional[dict]:
+        """Résultat pour cette profondeur (None : la plus profonde connue)."""
+        with self._lock:
+            result = None
+            if depth is not None and (fen, depth) in self._lru:
+                result = self._lru[(fen, depth)]
+                self._lru.move_to_end((fen, depth))
+            elif depth is None:
+                known = [d for (f, d) in self._lru if f == fen]
+                if known:
+                    result = self._lru[(fen, max(known))]
+
+            if result is None and self._db is not None:
+                if depth is None:
+                    row = self._db.execute(
+                        "SELECT depth, result FROM analyses WHERE fen = ?"
+                        " ORDER BY depth DESC LIMIT 1", (fen,)).fetchone()
+                else:
+                    row = self._db.execute(
+                        "SELECT depth, result FROM analyses WHERE fen = ? AND depth = ?",
+                        (fen, depth)).fetchone()
+                if row is not None:
+                    result = json.loads(row[1])
+                    self._remember((fen, row[0]), result)
+
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def put(self, fen: str, depth: int, result: dict) -> None:
+        with self._lock:
+            self._remember((fen, depth), result)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO analyses (fen, depth, result) VALUES (?, ?, ?)",
+                    (fen, depth, json.dumps(result)))
+                self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def _pv_to_text(board, turn: str, pv) -> list:
+    """Variante principale en notation numérique, rejouée sur une copie."""
+    b = clone_board(board)
+    color = turn
+    out = []
+    for start, seq in pv:
+        capture = any_capture_exists(b, color)
+        out.append(move_to_text(start, seq, capture))
+        pos = start
+        for to in seq:
+            # les pièces prises sont retrouvées par get_valid_moves
+            caps = b.get_valid_moves(b.grid[pos[0]][pos[1]]).get(to, [])
+            apply_single_step(b, pos, to, [(p.row, p.col) for p in caps])
+            pos = to
+        color = opponent(color)
+    return out
+
+
+class Analyzer:
+    def __init__(self, cache: Optional[AnalysisCache] = None,
+                 db_path: Optional[str] = None, cache_size: int = 4096):
+        self.cache = cache if cache is not None else AnalysisCache(cache_size, db_path)
+
+    def analyze(self, fen: str, depth: Optional[int] = None,
+                time_limit: Optional[float] = None) -> dict:
+        """
+        Analyse une position FEN. Sans time_limit : recherche à `depth`
+        (DEFAULT_DEPTH par défaut). Avec time_limit : approfondissement
+        jusqu'à l'échéance. La profondeur est ramenée à MAX_DEPTH ; ValueError
+        si elle ou le temps limite n'est pas strictement positif. Le score est
+        du point de vue du camp au trait.
+        """
+        if depth is not None:
+            if depth < 1:
+                raise ValueError("la profondeur doit être au moins 1")
+            depth = min(depth, MAX_DEPTH)
+        if time_limit is not None and not time_limit > 0:
+            raise ValueError("le temps limite doit être positif")
+        board, turn = parse_fen(fen)
+        key = to_fen(board, turn)   # forme canonique
+
+        known = None
+        if time_limit is None:
+            depth = depth or DEFAULT_DEPTH
+            cached = self.cache.get(key, depth)
+        else:
+            cached = known = self.cache.get(key, None)
+            # un résultat moins cher que ce budget serait dépassé par la recherche
+            if cached is not None and (
+                    (depth is not None and cached["depth"] < depth)
+                    or (cached.get("budget", 0.0) < time_limit
+                        and cached["depth"] < (depth or MAX_DEPTH))):
+                cached = None
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        bot = MinimaxBot(turn, depth=depth or MAX_DEPTH, search="pvs",
+                         time_limit=time_limit)
+        t0 = time.perf_counter()
+        best = bot.choose_move_sequence(board, turn)
+        elapsed = time.perf_counter() - t0
+
+        result = {
+            "fen": key,
+            "depth": bot.last_depth,
+            "score": None if bot.last_score is None else round(bot.last_score, 4),
+            "best": None if best is None else {
+                "start": list(best[0]), "path": [list(p) for p in best[1]]},
+            "pv": _pv_to_text(board, turn, bot.last_pv),
+            "nodes": bot.nodes,
+            "budget": round(elapsed if time_limit is None else time_limit, 4),
+        }
+        if known is not None and known["depth"] > bot.last_depth:
+            # la recherche n'a pas fait mieux : le résultat connu vaut pour ce budget
+            result = {**known, "budget": max(known.get("budget", 0.0), time_limit)}
+            self.cache.put(key, known["depth"], result)
+        elif bot.last_depth > 0:
+            self.cache.put(key, bot.last_depth, result)
+        return {**result, "cached": False}
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────
+def make_handler(analyzer: Analyzer):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/analyze":
+                self._reply(404, {"error": "chemin inconnu"})
+                return
+            q = parse_qs(url.query)
+            try:
+                fen = q["fen"][0]
+                depth = int(q["depth"][0]) if "depth" in q else None
+                time_limit = float(q["time"][0]) if "time" in q else None
+                self._reply(200, analyzer.analyze(fen, depth, time_limit))
+            except (KeyError, ValueError) as exc:
+                self._reply(400, {"error": str(exc)})
+
+        def _reply(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def serve(port: int, analyzer: Analyzer, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    return ThreadingHTTPServer((host, port), make_handler(analyzer))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Analyse de positions de dames")
+    ap.add_argument("fen", nargs="?", help="position FEN (ex. B:W21-32:B1-12)")
+    ap.add_argument("--depth", type=int, default=None)
+    ap.add_argument("--time", type=float, default=None, help="temps limite (s)")
+    ap.add_argument("--db", default=None, help="cache SQLite persistant")
+    ap.add_argument("--serve", type=int, metavar="PORT", default=None,
+                    help="lance le service HTTP au lieu d'analyser une position")
+    args = ap.parse_args()
+
+    analyzer = Analyzer(db_path=args.db)
+    if args.serve is not None:
+        httpd = serve(args.serve, analyzer)
+        print(f"Analyse sur http://127.0.0.1:{args.serve}/analyze?fen=...")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    elif args.fen:
+        print(json.dumps(analyzer.analyze(args.fen, args.depth, args.time), indent=2))
+    else:
+        ap.error("donner une position FEN ou --serve PORT")
@@ -0,0 +1,293 @@
+"""
+Bot Monte Carlo Tree Search (UCT) sur la représentation compacte
+(game/compact.py) : pas de Board ni de Piece dans l'arbre ni dans les
+simulations.
+
+Parallélisation à la racine : avec workers > 0, chaque processus construit
+son propre arbre (graine différente) pendant le temps alloué, puis les
+statistiques des coups racine sont additionnées et le coup le plus visité
+est joué. Le pool de processus est créé au premier coup et gardé pour toute
+la vie du bot (close() le libère) : le démarrage des processus n'est payé
+qu'une fois.
+
+Nulles : comme dans MinimaxBot, un nœud de l'arbre qui répète une position
+depuis le dernier coup irréversible (historique de la partie compris) ou qui
+atteint DRAW_QUIET_PLIES demi-coups sans progrès est une nulle. Les
+simulations appliquent la règle des coups sans progrès (pas les répétitions :
+elles sont de toute façon bornées par ROLLOUT_PLIES).
+
+Même interface que MinimaxBot :
+    MCTSBot(WHITE, time_limit=1.0, workers=4).choose_move_sequence(board, turn)
+"""
+import math
+import random
+import time
+from multiprocessing import Pool
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from game.board import Board
+from game.game import DRAW_QUIET_PLIES
+from game.piece import WHITE, BLACK
+from game.rules import Rules
+from game.compact import (legal_moves, pack, path_to_positions, geometry,
+                          BLACK_MAN, BLACK_KING, WHITE_MAN, WHITE_KING,
+                          WHITE_BIT, KING_BIT)
+from game.zobrist import TURN_KEY, piece_keys
+from ai.minimax_bot import opponent
+
+UCT_C         = 1.4
+ROLLOUT_PLIES = 120    # au-delà : partie arbitrée au matériel
+KING_WEIGHT   = 3
+
+
+# Code compact → indice des clés de piece_keys() (game/zobrist.py)
+_ZOBRIST_KIND = {BLACK_MAN: 0, BLACK_KING: 1, WHITE_MAN: 2, WHITE_KING: 3}
+
+
+def square_keys(rules: Optional[Rules] = None) -> List[List[int]]:
+    """Clés Zobrist de chaque case foncée, dans l'ordre de la position compacte."""
+    geo = geometry(rules)
+    keys = piece_keys(geo.rules.size)
+    return [keys[r][c] for r, c in geo.squares]
+
+
+def compact_hash(pos: bytes, turn: str, keys: Sequence[List[int]]) -> int:
+    """position_hash() d'une position compacte (mêmes clés, mêmes valeurs) ;
+    keys : square_keys() de la variante."""
+    h = TURN_KEY if turn == WHITE else 0
+    for i, v in enumerate(pos):
+        if v:
+            h ^= keys[i][_ZOBRIST_KIND[v]]
+    return h
+
+
+def _irreversible(before: bytes, path: Tuple[int, ...], after: bytes) -> bool:
+    """Prise (une case de moins occupée) ou mouvement de pion."""
+    return not before[path[0]] & KING_BIT or before.count(0) != after.count(0)
+
+
+class _Node:
+    __slots__ = ("pos", "turn", "parent", "path", "children", "untried",
+                 "visits", "wins", "hash", "quiet", "draw")
+
+    def __init__(self, pos: bytes, turn: str, parent=None, path=None,
+                 hash_: int = 0, quiet: int = 0, draw: bool = False):
+        self.pos = pos
+        self.turn = turn                  # camp au trait dans ce nœud
+        self.parent = parent
+        self.path = path                  # coup qui mène ici
+        self.children: List["_Node"] = []
+        self.untried = None               # coups pas encore développés
+        self.visits = 0
+        self.wins = 0.0                   # pour le camp qui a joué `path`
+        self.hash = hash_                 # compact_hash(pos, turn)
+        self.quiet = quiet                # demi-coups sans progrès avant ce nœud
+        self.draw = draw                  # nulle : nœud terminal
+
+    def uct_child(self) -> "_Node":
+        log_n = math.log(self.visits)
+        return max(self.children,
+                   key=lambda ch: ch.wins / ch.visits
+                   + UCT_C * math.sqrt(log_n / ch.visits))
+
+
+def _material_winner(pos: bytes) -> Optional[str]:
+    score = 0
+    for v in pos:
+        if v:
+            w = KING_WEIGHT if v & KING_BIT else 1
+            score += -w if v & WHITE_BIT else w
+    if score > 0:
+        return BLACK
+    if score < 0:
+        return WHITE
+    return None
+
+
+def _rollout(pos: bytes, turn: str, rng: random.Random,
+             rules: Optional[Rules] = None, quiet: int = 0) -> Optional[str]:
+    """Politique rapide : au hasard, mais toujours une des rafles les plus
+    longues quand il y a prise. Retourne le vainqueur (None = nul).
+    quiet : demi-coups sans progrès avant la position de départ."""
+    for _ in range(ROLLOUT_PLIES):
+        if quiet >= DRAW_QUIET_PLIES:
+            return None
+        moves = legal_moves(pos, turn, rules)
+        if not moves:
+            return opponent(turn)
+        longest = len(moves[0][0])
+        if longest > 2:
+            moves = [m for m in moves if len(m[0]) == longest]
+        path, after = rng.choice(moves)
+        quiet = 0 if _irreversible(pos, path, after) else quiet + 1
+        pos = after
+        turn = opponent(turn)
+    return _material_winner(pos)
+
+
+def _child(node: _Node, path: Tuple[int, ...], after: bytes,
+           history: FrozenSet[int], keys) -> _Node:
+    """Fils de node par path, avec son état de nulle : répétition d'une
+    position depuis le dernier coup irréversible (chemin dans l'arbre, puis
+    history, les positions de la partie) ou DRAW_QUIET_PLIES atteint."""
+    turn = opponent(node.turn)
+    h = compact_hash(after, turn, keys)
+    if _irreversible(node.pos, path, after):
+        return _Node(after, turn, node, path, h, 0)
+    quiet = node.quiet + 1
+    draw = quiet >= DRAW_QUIET_PLIES
+    anc, steps = node, quiet
+    while not draw and anc is not None and steps > 0:
+        draw = anc.hash == h
+        anc, steps = anc.parent, steps - 1
+    if not draw and anc is None and steps > 0:
+        draw = h in history
+    return _Node(after, turn, node, path, h, quiet, draw)
+
+
+def search_tree(pos: bytes, turn: str, time_limit: Optional[float],
+                iterations: Optional[int], seed: Optional[int],
+                rules: Optional[Rules] = None,
+                history: FrozenSet[int] = frozenset(),
+                quiet_plies: int = 0) -> Dict[tuple, Tuple[int, float]]:
+    """Construit un arbre UCT ; retourne {chemin racine: (visites, gains)}.
+    history : hachages des positions de la partie depuis le dernier coup
+    irréversible (Game.history), quiet_plies : Game.quiet_plies."""
+    rng = random.Random(seed)
+    keys = square_keys(rules)
+    root = _Node(pos, turn, hash_=compact_hash(pos, turn, keys), quiet=quiet_plies)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    done = 0
+
+    while True:
+        if iterations is not None and done >= iterations:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        done += 1
+
+        # 1. Sélection
+        node = root
+        while node.untried is not None and not node.untried and node.children:
+            node = node.uct_child()
+
+        # 2. Expansion
+        if node.untried is None:
+            node.untried = [] if node.draw else legal_moves(node.pos, node.turn, rules)
+            rng.shuffle(node.untried)
+        if node.untried:
+            path, after = node.untried.pop()
+            child = _child(node, path, after, history, keys)
+            node.children.append(child)
+            node = child
+
+        # 3. Simulation
+        if node.draw:
+            winner = None
+        else:
+            winner = _rollout(node.pos, node.turn, rng, rules, node.quiet)
+
+        # 4. Rétropropagation
+        while node is not None:
+            node.visits += 1
+            mover = opponent(node.turn)
+            if winner is None:
+                node.wins += 0.5
+            elif winner == mover:
+                node.wins += 1.0
+            node = node.parent
+
+    return {ch.path: (ch.visits, ch.wins) for ch in root.children}
+
+
+def _search_job(args):
+    """search_tree dans un processus du pool ; ajoute le temps CPU consommé
+    (les processus du pool ne se terminent pas : os.times() ne le voit pas)."""
+    t0 = time.process_time()
+    stats = search_tree(*args)
+    return stats, time.process_time() - t0
+
+
+class MCTSBot:
+    """
+    time_limit : secondes par coup (par processus).
+    iterations : nombre de simulations par processus (si time_limit est None,
+                 ou plafond supplémentaire).
+    workers    : 0 = dans le processus courant ; N > 0 = N arbres en parallèle,
+                 dans un pool créé au premier coup et réutilisé ensuite ;
+                 close() le libère.
+    """
+
+    def __init__(self, color: str, time_limit: Optional[float] = 1.0,
+                 iterations: Optional[int] = None, workers: int = 0,
+                 seed: Optional[int] = None):
+        if time_limit is None and iterations is None:
+            raise ValueError("time_limit ou iterations est requis")
+        self.color = color
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self._pool: Optional[Pool] = None
+
+        # Temps CPU cumulé des processus du pool (voir ai/selfplay.py)
+        self.worker_cpu = 0.0
+        # Statistiques de la dernière recherche
+        self.simulations = 0
+        self.last_stats: Dict[tuple, Tuple[int, float]] = {}
+
+    def close(self) -> None:
+        """Arrête le pool de processus (recréé au besoin au coup suivant)."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "MCTSBot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def choose_move_sequence(self, board: Board, turn_color: str,
+                             history: Optional[Sequence[int]] = None,
+                             quiet_plies: int = 0):
+        """history / quiet_plies : Game.history et Game.quiet_plies, pour
+        voir les nulles par répétition ou par absence de progrès (comme
+        MinimaxBot)."""
+        rules = board.rules
+        pos = pack(board)
+        moves = legal_moves(pos, turn_color, rules)
+        if not moves:
+            return None
+        if len(moves) == 1:
+            self.simulations = 0
+            self.last_stats = {}
+            return path_to_positions(moves[0][0], rules)
+
+        n = max(1, self.workers)
+        seen = frozenset(history or ())
+        jobs = [(pos, turn_color, self.time_limit, self.iterations,
+                 self.rng.getrandbits(32), rules, seen, quiet_plies)
+                for _ in range(n)]
+        if self.workers > 0:
+            if self._pool is None:
+                self._pool = Pool(self.workers)
+            results = []
+            for stats, cpu in self._pool.map(_search_job, jobs):
+                results.append(stats)
+                self.worker_cpu += cpu
+        else:
+            results = [search_tree(*jobs[0])]
+
+        merged: Dict[tuple, List[float]] = {}
+        for stats in results:
+            for path, (visits, wins) in stats.items():
+                acc = merged.setdefault(path, [0, 0.0])
+                acc[0] += visits
+                acc[1] += wins
+
+        self.last_stats = {p: (int(v), w) for p, (v, w) in merged.items()}
+        self.simulations = sum(v for v, _ in merged.values())
+        best = max(merged, key=lambda p: merged[p][0])
+        return path_to_positions(best, rules)
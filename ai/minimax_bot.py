@@ -1,8 +1,12 @@
-from typing import List, Tuple, Optional, Dict
+from typing import Callable, List, Tuple, Optional, Dict, Sequence
 import math
+import time
 
 from game.board import Board
+from game.captures import max_capture_chains
+from game.game import DRAW_QUIET_PLIES
 from game.piece import Piece, WHITE, BLACK
+from game.zobrist import position_hash
 
 Pos = Tuple[int, int]
 MoveSeq = List[Pos]
@@ -13,17 +17,16 @@ def opponent(color: str) -> str:
 
 
 def clone_board(board: Board) -> Board:
-    new_b = Board()
-    new_b.grid = [[None for _ in range(8)] for _ in range(8)]
-    for r in range(8):
-        for c in range(8):
-            p = board.grid[r][c]
+    new_b = Board(setup=False, rules=board.rules)
+    grid = new_b.grid
+    for r, row in enumerate(board.grid):
+        for c, p in enumerate(row):
             if p is None:
                 continue
             cp = Piece(p.row, p.col, p.color)
             if p.is_king:
                 cp.make_king()
-            new_b.grid[r][c] = cp
+            grid[r][c] = cp
     return new_b
 
 
@@ -32,9 +35,8 @@ def capture_moves_only(moves: Dict[Pos, List[Piece]]) -> Dict[Pos, List[Piece]]:
 
 
 def any_capture_exists(board: Board, color: str) -> bool:
-    for r in range(8):
-        for c in range(8):
-            p = board.grid[r][c]
+    for row in board.grid:
+        for p in row:
             if p is None or p.color != color:
                 continue
             moves = board.get_valid_moves(p)
@@ -49,8 +51,9 @@ def get_piece(board: Board, pos: Pos) -> Optional[Piece]:
 
 
 def remove_by_positions(board: Board, positions: List[Pos]) -> None:
+    size = board.rules.size
     for r, c in positions:
-        if 0 <= r < 8 and 0 <= c < 8:
+        if 0 <= r < size and 0 <= c < size:
             board.grid[r][c] = None
 
 
@@ -64,64 +67,144 @@ def apply_single_step(board: Board, from_pos: Pos, to_pos: Pos, captured_positio
         remove_by_positions(board, captured_positions)
 
 
+def make_step(board: Board, from_pos: Pos, to_pos: Pos, captured_positions: List[Pos]):
+    """Joue un pas sur place et retourne de quoi l'annuler avec unmake_step()."""
+    piece = get_piece(board, from_pos)
+    captured = [board.grid[r][c] for r, c in captured_positions]
+    was_king = piece.is_king
+    tr, tc = to_pos
+    board.move(piece, tr, tc)
+    remove_by_positions(board, captured_positions)
+    return piece, from_pos, was_king, captured
+
+
+def unmake_step(board: Board, undo) -> None:
+    """Annule un pas joué par make_step() (y compris une promotion)."""
+    piece, (fr, fc), was_king, captured = undo
+    board.grid[piece.row][piece.col] = None
+    board.grid[fr][fc] = piece
+    piece.move_to(fr, fc)
+    piece.is_king = was_king
+    for p in captured:
+        board.grid[p.row][p.col] = p
+
+
+def gen_capture_chains(board: Board, start_pos: Pos,
+                       clone: Callable[[Board], Board] = clone_board
+                       ) -> List[Tuple[Board, MoveSeq, List[Pos]]]:
+    """
+    Chaînes de captures complètes depuis start_pos, sous forme
+    (plateau final, séquence, positions capturées).
+
+    La chaîne est parcourue sur le plateau reçu (make/unmake, restauré à la
+    fin) : seul le plateau final de chaque chaîne est cloné (par clone). Les pièces
+    prises sont retirées au fur et à mesure, elles ne peuvent donc pas être
+    sautées deux fois. Deux chaînes qui finissent sur la même case avec le
+    même ensemble de prises donnent la même position : une seule est gardée.
+    """
+    results: List[Tuple[Board, MoveSeq, List[Pos]]] = []
+    seen = set()
+    path: MoveSeq = []
+    taken: List[Pos] = []
+
+    def walk(pos: Pos) -> None:
+        piece = get_piece(board, pos)
+        moves = capture_moves_only(board.get_valid_moves(piece))
+        if not moves:
+            if path:
+                key = (pos, piece.is_king, frozenset(taken))
+                if key not in seen:
+                    seen.add(key)
+                    results.append((clone(board), list(path), list(taken)))
+            return
+
+        for to_pos, captured in moves.items():
+            captured_positions = [(p.row, p.col) for p in captured]
+            undo = make_step(board, pos, to_pos, captured_positions)
+            path.append(to_pos)
+            taken.extend(captured_positions)
+            walk(to_pos)
+            del taken[len(taken) - len(captured_positions):]
+            path.pop()
+            unmake_step(board, undo)
+
+    if get_piece(board, start_pos) is not None:
+        walk(start_pos)
+    return results
+
+
 def gen_capture_sequences(board: Board, start_pos: Pos) -> List[Tuple[Board, MoveSeq]]:
-    piece = get_piece(board, start_pos)
-    if piece is None:
+    if get_piece(board, start_pos) is None:
         return []
 
-    moves = capture_moves_only(board.get_valid_moves(piece))
-    if not moves:
+    chains = gen_capture_chains(board, start_pos)
+    if not chains:
         return [(board, [])]
-
-    results: List[Tuple[Board, MoveSeq]] = []
-    for to_pos, captured in moves.items():
-        captured_positions = [(p.row, p.col) for p in captured]
-        b2 = clone_board(board)
-        apply_single_step(b2, start_pos, to_pos, captured_positions)
-        for b_final, seq in gen_capture_sequences(b2, to_pos):
-            results.append((b_final, [to_pos] + seq))
+    return [(b_final, seq) for b_final, seq, _ in chains]
+
+
+def gen_max_capture_chains(board: Board, color: str,
+                           clone: Callable[[Board], Board] = clone_board
+                           ) -> List[Tuple[Board, Pos, MoveSeq]]:
+    """
+    Prise majoritaire (rules.max_capture) : rafles maximales de tout le camp
+    (game/captures.py), rejouées sur un clone. Comme dans gen_capture_chains,
+    une seule rafle par position résultante.
+    """
+    results: List[Tuple[Board, Pos, MoveSeq]] = []
+    seen = set()
+    for start_pos, seq, taken in max_capture_chains(board, color)[1]:
+        b2 = clone(board)
+        prev = start_pos
+        for to_pos, cap in zip(seq, taken):
+            apply_single_step(b2, prev, to_pos, [cap])
+            prev = to_pos
+        key = (start_pos, prev, get_piece(b2, prev).is_king, frozenset(taken))
+        if key not in seen:
+            seen.add(key)
+            results.append((b2, start_pos, seq))
     return results
 
 
 def generate_all_turn_moves(board: Board, color: str) -> List[Tuple[Board, Pos, MoveSeq]]:
+    return turn_moves(board, color)[0]
+
+
+def turn_moves(board: Board, color: str, clone: Callable[[Board], Board] = clone_board
+               ) -> Tuple[List[Tuple[Board, Pos, MoveSeq]], bool]:
+    """Comme generate_all_turn_moves, et indique si les coups sont des prises.
+    clone : copie des plateaux résultants (SearchContext.clone_board)."""
     moves_list: List[Tuple[Board, Pos, MoveSeq]] = []
     must_capture = any_capture_exists(board, color)
+    if must_capture and board.rules.max_capture:
+        return gen_max_capture_chains(board, color, clone), True
 
-    for r in range(8):
-        for c in range(8):
-            p = board.grid[r][c]
+    for r, row in enumerate(board.grid):
+        for c, p in enumerate(row):
             if p is None or p.color != color:
                 continue
 
-            base_moves = board.get_valid_moves(p)
+            start_pos = (r, c)
             if must_capture:
-                base_moves = capture_moves_only(base_moves)
-                if not base_moves:
-                    continue
+                for b_final, seq, _ in gen_capture_chains(board, start_pos, clone):
+                    moves_list.append((b_final, start_pos, seq))
+                continue
 
-            start_pos = (r, c)
-            for to_pos, captured in base_moves.items():
-                captured_positions = [(x.row, x.col) for x in captured]
-                b2 = clone_board(board)
-                apply_single_step(b2, start_pos, to_pos, captured_positions)
-
-                if captured_positions:
-                    chains = gen_capture_sequences(b2, to_pos)
-                    for b_final, extra_seq in chains:
-                        moves_list.append((b_final, start_pos, [to_pos] + extra_seq))
-                else:
-                    moves_list.append((b2, start_pos, [to_pos]))
+            for to_pos in board.get_valid_moves(p):
+                b2 = clone(board)
+                apply_single_step(b2, start_pos, to_pos, [])
+                moves_list.append((b2, start_pos, [to_pos]))
 
     # Tri : captures en premier pour améliorer le pruning alpha-bêta
     moves_list.sort(key=lambda m: len(m[2]), reverse=True)
-    return moves_list
+    return moves_list, must_capture
 
 
 # ------------------------------------------------------------------
 # Table de bonus positionnel par case (8x8)
 # Pions noirs avancent vers les lignes 4-7, blancs vers 0-3.
 # ------------------------------------------------------------------
-_CENTER_BONUS = [
+_CENTER_BONUS_8 = [
     [0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00],
     [0.00, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.00],
     [0.00, 0.02, 0.05, 0.06, 0.06, 0.05, 0.02, 0.00],
@@ -131,6 +214,20 @@ _CENTER_BONUS = [
     [0.00, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.00],
     [0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00, 0.00],
 ]
+# Autres tailles : bonus selon la distance au bord (anneaux concentriques)
+_RING_BONUS = (0.00, 0.02, 0.06, 0.10, 0.12)
+_CENTER_BONUS: Dict[int, List[List[float]]] = {8: _CENTER_BONUS_8}
+
+
+def center_bonus(size: int) -> List[List[float]]:
+    table = _CENTER_BONUS.get(size)
+    if table is None:
+        last = size - 1
+        table = _CENTER_BONUS[size] = [
+            [_RING_BONUS[min(r, c, last - r, last - c, len(_RING_BONUS) - 1)]
+             for c in range(size)]
+            for r in range(size)]
+    return table
 
 
 def evaluate(board: Board, color: str) -> float:
@@ -146,33 +243,34 @@ def evaluate(board: Board, color: str) -> float:
     my_mob    = 0
     opp_mob   = 0
 
-    for r in range(8):
-        for c in range(8):
-            p = board.grid[r][c]
+    last = board.rules.size - 1
+    bonus = center_bonus(last + 1)
+    for r, row in enumerate(board.grid):
+        for c, p in enumerate(row):
             if p is None:
                 continue
 
             val = KING_VAL if p.is_king else MAN_VAL
-            pos_bonus = _CENTER_BONUS[r][c]
+            pos_bonus = bonus[r][c]
             mob = len(board.get_valid_moves(p))
 
             if p.color == color:
                 my_score += val + pos_bonus
                 if not p.is_king:
                     # avancement vers la promotion
-                    adv_row = r if color == BLACK else (7 - r)
+                    adv_row = r if color == BLACK else (last - r)
                     my_score += ADV * adv_row
                     # protection rangée arrière
-                    back = 0 if color == BLACK else 7
+                    back = 0 if color == BLACK else last
                     if r == back:
                         my_score += BACK_ROW
                 my_mob += mob
             else:
                 opp_score += val + pos_bonus
                 if not p.is_king:
-                    adv_row = r if opp == BLACK else (7 - r)
+                    adv_row = r if opp == BLACK else (last - r)
                     opp_score += ADV * adv_row
-                    back = 0 if opp == BLACK else 7
+                    back = 0 if opp == BLACK else last
                     if r == back:
                         opp_score += BACK_ROW
                 opp_mob += mob
@@ -181,11 +279,11 @@ def evaluate(board: Board, color: str) -> float:
     return score
 
 
-def terminal_winner(board: Board) -> Optional[str]:
+def terminal_winner(board: Board, clone: Callable[[Board], Board] = clone_board
+                    ) -> Optional[str]:
     black_exists = white_exists = False
-    for r in range(8):
-        for c in range(8):
-            p = board.grid[r][c]
+    for row in board.grid:
+        for p in row:
             if p is None:
                 continue
             if p.color == BLACK:
@@ -197,57 +295,480 @@ def terminal_winner(board: Board) -> Optional[str]:
         return WHITE
     if not white_exists:
         return BLACK
-    if not generate_all_turn_moves(board, BLACK):
+    if not turn_moves(board, BLACK, clone)[0]:
         return WHITE
-    if not generate_all_turn_moves(board, WHITE):
+    if not turn_moves(board, WHITE, clone)[0]:
         return BLACK
     return None
 
 
+# ------------------------------------------------------------------
+# Nulles dans l'arbre : répétition et règle des coups sans progrès
+# ------------------------------------------------------------------
+DRAW_SCORE = 0.0
+
+
+def _is_irreversible(board: Board, start_pos: Pos, captures: bool) -> bool:
+    """Prise ou mouvement de pion : aucune position antérieure ne peut revenir."""
+    return captures or not get_piece(board, start_pos).is_king
+
+
+def _child_draw(reps: Dict[int, int], b2: Board, turn: str,
+                quiet_plies: int) -> Tuple[bool, Optional[int]]:
+    """(nulle ?, hachage à empiler) pour un fils atteint par un coup calme.
+    Dans l'arbre, la première répétition suffit : rejouer la position ne
+    peut rien apporter de plus que la nulle."""
+    if quiet_plies >= DRAW_QUIET_PLIES:
+        return True, None
+    h = position_hash(b2, turn)
+    return bool(reps.get(h)), h
+
+
+def root_repetitions(board: Board, turn: str,
+                     history: Optional[Sequence[int]] = None) -> Dict[int, int]:
+    """Compteurs de positions de départ de la recherche : l'historique de la
+    partie (Game.history) s'il est fourni, sinon la seule position racine."""
+    reps: Dict[int, int] = {}
+    for h in history or (position_hash(board, turn),):
+        reps[h] = reps.get(h, 0) + 1
+    return reps
+
+
 def minimax(board: Board, depth: int, alpha: float, beta: float,
-            current: str, bot_color: str):
-    win = terminal_winner(board)
+            current: str, bot_color: str, stats: Optional[Dict[str, int]] = None,
+            reps: Optional[Dict[int, int]] = None, quiet_plies: int = 0,
+            evaluator: Optional[Callable[[Board, str], float]] = None,
+            ctx: Optional["SearchContext"] = None):
+    """evaluator : fonction d'évaluation des feuilles, evaluate() par défaut ;
+    si elle a une méthode prefetch (ai/nn_eval.py), les fils des nœuds de
+    profondeur 1 lui sont passés en un seul lot. ctx : fonctions de la
+    recherche (SearchContext, éventuellement chronométrées), créé à la racine."""
+    if ctx is None:
+        ctx = SearchContext(evaluator=evaluator)
+    if stats is not None:
+        stats["nodes"] += 1
+    if reps is None:
+        reps = root_repetitions(board, current)
+
+    win = ctx.terminal_winner(board)
     if win is not None:
         return (10000.0, None) if win == bot_color else (-10000.0, None)
 
     if depth == 0:
-        return evaluate(board, bot_color), None
+        return ctx.evaluate(board, bot_color), None
 
-    moves = generate_all_turn_moves(board, current)
+    moves, captures = ctx.turn_moves(board, current)
     if not moves:
         return (-10000.0, None) if current == bot_color else (10000.0, None)
+    if depth == 1 and ctx.prefetch is not None:
+        ctx.prefetch([b2 for b2, _, _ in moves])
 
     best_move = None
-
-    if current == bot_color:
-        best_val = -math.inf
-        for b2, start_pos, seq in moves:
-            val, _ = minimax(b2, depth - 1, alpha, beta, opponent(current), bot_color)
+    maximizing = current == bot_color
+    best_val = -math.inf if maximizing else math.inf
+    opp = opponent(current)
+
+    for b2, start_pos, seq in moves:
+        if _is_irreversible(board, start_pos, captures):
+            child_quiet, draw, h = 0, False, None
+        else:
+            child_quiet = quiet_plies + 1
+            draw, h = _child_draw(reps, b2, opp, child_quiet)
+
+        if draw:
+            val = DRAW_SCORE
+        else:
+            if h is not None:
+                reps[h] = reps.get(h, 0) + 1
+            val, _ = minimax(b2, depth - 1, alpha, beta, opp, bot_color, stats,
+                             reps, child_quiet, evaluator, ctx)
+            if h is not None:
+                reps[h] -= 1
+
+        if maximizing:
             if val > best_val:
                 best_val = val
                 best_move = (start_pos, seq)
             alpha = max(alpha, best_val)
-            if beta <= alpha:
-                break
-        return best_val, best_move
-    else:
-        best_val = math.inf
-        for b2, start_pos, seq in moves:
-            val, _ = minimax(b2, depth - 1, alpha, beta, opponent(current), bot_color)
+        else:
             if val < best_val:
                 best_val = val
                 best_move = (start_pos, seq)
             beta = min(beta, best_val)
-            if beta <= alpha:
+        if beta <= alpha:
+            break
+    return best_val, best_move
+
+
+# ------------------------------------------------------------------
+# Principal Variation Search (forme negamax)
+# Le score est toujours du point de vue du joueur `current`.
+# ------------------------------------------------------------------
+MATE = 10000.0
+NULL_WINDOW = 1e-6   # largeur de la fenêtre nulle (scores flottants)
+
+# Late move reductions : à partir du LMR_FULL_MOVES-ième coup, les coups
+# calmes sont d'abord cherchés LMR_REDUCTION demi-coups moins profond.
+LMR_MIN_DEPTH  = 3
+LMR_FULL_MOVES = 3
+LMR_REDUCTION  = 1
+FUTILITY_MARGIN = 0.6   # moins qu'un pion : seuls les coups sans enjeu matériel
+
+
+class SearchTimeout(Exception):
+    """Levée dans pvs() quand l'échéance de la recherche est dépassée."""
+
+
+class SearchContext:
+    """État partagé par tous les nœuds d'une recherche pvs()."""
+
+    def __init__(self, deadline: Optional[float] = None, lmr: bool = False,
+                 futility: Optional[float] = None,
+                 evaluator: Optional[Callable[[Board, str], float]] = None,
+                 timers: Optional["PhaseTimers"] = None):
+        self.nodes = 0
+        self.lmr = lmr
+        # Marge de futilité aux nœuds frontière (None = désactivée)
+        self.futility = futility
+        # Heuristique d'historique, conservée entre les itérations
+        self.history: Dict[tuple, int] = {}
+        # Échéance (time.perf_counter()) ou None
+        self.deadline = deadline
+        # Positions de la partie et du chemin courant depuis le dernier coup
+        # irréversible (hachage → occurrences), voir root_repetitions()
+        self.reps: Dict[int, int] = {}
+        # Évaluation des feuilles ; prefetch : évaluation par lot des fils
+        # d'un nœud de profondeur 1 (voir ai/nn_eval.py), ou None
+        self.evaluate = evaluator or evaluate
+        self.prefetch = getattr(evaluator, "prefetch", None)
+        # Génération de coups, copie des plateaux qu'elle produit et test de
+        # fin de partie de la recherche
+        self.clone_board = clone_board
+        self.turn_moves = self._turn_moves
+        self.terminal_winner = self._terminal_winner
+        # Mode profilage : ces fonctions sont remplacées, dans ce contexte
+        # seulement, par des versions chronométrées
+        if timers is not None:
+            timers.instrument(self)
+
+    def _turn_moves(self, board: Board, color: str):
+        return turn_moves(board, color, self.clone_board)
+
+    def _terminal_winner(self, board: Board) -> Optional[str]:
+        return terminal_winner(board, self.clone_board)
+
+
+def _promotes(board: Board, after: Board, start_pos: Pos, seq: MoveSeq) -> bool:
+    r, c = seq[-1]
+    return not get_piece(board, start_pos).is_king and after.grid[r][c].is_king
+
+
+def pvs(board: Board, depth: int, alpha: float, beta: float, current: str,
+        ctx: Optional[SearchContext] = None,
+        pv_hint: Optional[List[Tuple[Pos, MoveSeq]]] = None,
+        quiet_plies: int = 0):
+    """Negamax PVS : fenêtre complète pour le premier coup, fenêtre nulle
+    pour les suivants avec re-recherche si le coup dépasse alpha.
+    Retourne (score, pv) où pv est la liste des coups (start_pos, seq).
+    quiet_plies : demi-coups sans prise ni mouvement de pion avant ce nœud.
+    """
+    if ctx is None:
+        ctx = SearchContext()
+    ctx.nodes += 1
+    if ctx.deadline is not None and time.perf_counter() > ctx.deadline:
+        raise SearchTimeout
+
+    win = ctx.terminal_winner(board)
+    if win is not None:
+        return (MATE if win == current else -MATE), []
+
+    if depth == 0:
+        return ctx.evaluate(board, current), []
+
+    moves, captures = ctx.turn_moves(board, current)
+    if not moves:
+        return -MATE, []
+
+    # Futilité : à un nœud frontière sans prise, si même l'évaluation statique
+    # plus la marge n'atteint pas alpha, les coups calmes sont ignorés.
+    futile_bound = None
+    if (ctx.futility is not None and depth == 1 and not captures
+            and alpha > -math.inf):
+        bound = ctx.evaluate(board, current) + ctx.futility
+        if bound <= alpha:
+            futile_bound = bound
+
+    # Heuristique d'historique : les coups ayant provoqué des coupures
+    # ailleurs dans l'arbre passent devant (tri stable, captures d'abord)
+    history = ctx.history
+    if history:
+        moves.sort(key=lambda m: (len(m[2]), history.get((m[1], tuple(m[2])), 0)),
+                   reverse=True)
+
+    # Coup de la variante principale précédente en tête
+    child_hint = None
+    if pv_hint:
+        for i, (_, start_pos, seq) in enumerate(moves):
+            if (start_pos, seq) == pv_hint[0]:
+                moves.insert(0, moves.pop(i))
+                child_hint = pv_hint[1:]
                 break
-        return best_val, best_move
+
+    # Feuilles évaluées en un lot (sauf si la futilité écarte les coups calmes)
+    if depth == 1 and ctx.prefetch is not None and futile_bound is None:
+        ctx.prefetch([b2 for b2, _, _ in moves])
+
+    opp = opponent(current)
+    best_val = -math.inf
+    best_pv: List[Tuple[Pos, MoveSeq]] = []
+
+    reps = ctx.reps
+    for i, (b2, start_pos, seq) in enumerate(moves):
+        # Prises et promotions ne sont jamais réduites ni élaguées
+        quiet = not captures and not _promotes(board, b2, start_pos, seq)
+        if _is_irreversible(board, start_pos, captures):
+            child_quiet, draw, h = 0, False, None
+        else:
+            child_quiet = quiet_plies + 1
+            draw, h = _child_draw(reps, b2, opp, child_quiet)
+
+        if draw:
+            val, child_pv = DRAW_SCORE, []
+        elif i > 0 and futile_bound is not None and quiet:
+            best_val = max(best_val, futile_bound)
+            continue
+        else:
+            if h is not None:
+                reps[h] = reps.get(h, 0) + 1
+            try:
+                val, child_pv = _pvs_child(b2, depth, alpha, beta, opp, ctx,
+                                           child_hint if i == 0 else None,
+                                           child_quiet, i, quiet)
+            finally:
+                if h is not None:
+                    reps[h] -= 1
+
+        if val > best_val:
+            best_val = val
+            best_pv = [(start_pos, seq)] + child_pv
+        alpha = max(alpha, val)
+        if alpha >= beta:
+            key = (start_pos, tuple(seq))
+            history[key] = history.get(key, 0) + depth * depth
+            break
+
+    return best_val, best_pv
+
+
+def _pvs_child(b2: Board, depth: int, alpha: float, beta: float, opp: str,
+               ctx: SearchContext, hint, quiet_plies: int, index: int, quiet: bool):
+    """Score (point de vue du père) d'un fils de pvs() : fenêtre complète pour
+    le premier coup, sinon fenêtre nulle (réduite si LMR) et re-recherches."""
+    if index == 0:
+        val, child_pv = pvs(b2, depth - 1, -beta, -alpha, opp, ctx, hint, quiet_plies)
+        return -val, child_pv
+
+    val = None
+    if ctx.lmr and quiet and depth >= LMR_MIN_DEPTH and index >= LMR_FULL_MOVES:
+        val, child_pv = pvs(b2, depth - 1 - LMR_REDUCTION,
+                            -alpha - NULL_WINDOW, -alpha, opp, ctx, None, quiet_plies)
+        val = -val
+    if val is None or val > alpha:
+        # pas de réduction, ou fail-high réduit : profondeur complète
+        val, child_pv = pvs(b2, depth - 1, -alpha - NULL_WINDOW, -alpha, opp, ctx,
+                            None, quiet_plies)
+        val = -val
+    if alpha < val < beta:
+        # fail-high : le coup est peut-être meilleur, on re-cherche
+        val, child_pv = pvs(b2, depth - 1, -beta, -val, opp, ctx, None, quiet_plies)
+        val = -val
+    return val, child_pv
+
+
+# ------------------------------------------------------------------
+# Compteurs par phase (mode profilage)
+# ------------------------------------------------------------------
+# phase → attribut de SearchContext chronométré
+PHASES = {
+    "movegen":  "turn_moves",
+    "clone":    "clone_board",
+    "eval":     "evaluate",
+    "terminal": "terminal_winner",
+}
+
+
+def add_phases(totals: Dict[str, List[float]], phases: Dict[str, List[float]]) -> None:
+    """Cumule des compteurs {phase: [appels, secondes]} dans totals."""
+    for phase, (n, seconds) in phases.items():
+        acc = totals.setdefault(phase, [0, 0.0])
+        acc[0] += n
+        acc[1] += seconds
+
+
+class PhaseTimers:
+    """
+    Compteurs par phase d'une recherche (MinimaxBot(profile=True)) :
+    instrument(ctx) remplace les fonctions de PHASES par des versions
+    chronométrées dans ce seul SearchContext. Rien n'est modifié au niveau
+    du module : les autres bots, et les autres threads (l'interface qui
+    appelle game.winner() pendant que le bot cherche), ne sont pas comptés.
+
+    Temps inclusifs : "movegen" comprend Board.get_valid_moves et les
+    clones, "eval" les évaluations par lot (prefetch), et la génération de
+    coups faite par terminal_winner compte dans "terminal". "clone" compte
+    les copies de plateaux faites par ces deux phases. Le détail par
+    fonction est dans le rapport cProfile (ai/profiling.py).
+    """
+
+    def __init__(self):
+        self.calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+    def _timed(self, phase: str, fn):
+        calls, seconds = self.calls, self.seconds
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            t0 = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds[phase] += clock() - t0
+                calls[phase] += 1
+        return wrapper
+
+    def instrument(self, ctx: SearchContext) -> None:
+        for phase, attr in PHASES.items():
+            setattr(ctx, attr, self._timed(phase, getattr(ctx, attr)))
+        if ctx.prefetch is not None:
+            ctx.prefetch = self._timed("eval", ctx.prefetch)
+
+    def add_to(self, totals: Dict[str, List[float]]) -> None:
+        """Cumule dans totals[phase] = [appels, secondes]."""
+        add_phases(totals, {p: [n, self.seconds[p]] for p, n in self.calls.items()})
 
 
 class MinimaxBot:
-    def __init__(self, color: str, depth: int = 6):
+    """
+    search     : "alphabeta" (minimax classique) ou "pvs" (negamax PVS
+                 avec approfondissement itératif).
+    aspiration : demi-largeur de la fenêtre d'aspiration autour du score
+                 de l'itération précédente (mode "pvs", None = désactivée).
+    time_limit : secondes allouées à un coup (mode "pvs") ; l'approfondissement
+                 s'arrête à l'échéance et garde la dernière itération complète.
+                 La profondeur 1 est toujours terminée.
+    lmr        : late move reductions sur les coups calmes tardifs (mode "pvs").
+    futility   : marge d'élagage de futilité aux nœuds frontière (mode "pvs",
+                 None = désactivé ; FUTILITY_MARGIN est une valeur raisonnable).
+    profile    : chronomètre les phases de chaque recherche (PhaseTimers, propres
+                 à ce bot) ; totaux cumulés dans self.phases[phase] =
+                 [appels, secondes].
+    evaluator  : évaluation des feuilles (board, color) → score, evaluate()
+                 par défaut ; par exemple un MLPEvaluator (ai/nn_eval.py).
+    weights    : fichier .npz de poids d'un MLPEvaluator, chargé à la
+                 construction (NumPy requis).
+
+    choose_move_sequence(board, turn, history, quiet_plies) : history et
+    quiet_plies (Game.history, Game.quiet_plies) permettent de voir les
+    nulles par répétition ou par absence de progrès ; sans eux, seules les
+    répétitions à l'intérieur de l'arbre sont détectées.
+    """
+
+    def __init__(self, color: str, depth: int = 6, search: str = "alphabeta",
+                 aspiration: Optional[float] = 0.5,
+                 time_limit: Optional[float] = None, lmr: bool = False,
+                 futility: Optional[float] = None, profile: bool = False,
+                 evaluator: Optional[Callable[[Board, str], float]] = None,
+                 weights: Optional[str] = None):
+        if search not in ("alphabeta", "pvs"):
+            raise ValueError(f"search inconnu : {search!r}")
+        if search != "pvs" and (time_limit is not None or lmr or futility is not None):
+            raise ValueError("time_limit, lmr et futility demandent search=\"pvs\"")
         self.color = color
         self.depth = depth
-
-    def choose_move_sequence(self, board: Board, turn_color: str):
-        _, best = minimax(board, self.depth, -math.inf, math.inf, turn_color, self.color)
+        self.search = search
+        self.aspiration = aspiration
+        self.time_limit = time_limit
+        self.lmr = lmr
+        self.futility = futility
+        self.profile = profile
+        if weights is not None:
+            if evaluator is not None:
+                raise ValueError("evaluator et weights sont exclusifs")
+            from ai.nn_eval import MLPEvaluator   # NumPy : dépendance optionnelle
+            evaluator = MLPEvaluator.load(weights)
+        self.evaluator = evaluator
+
+        # Statistiques de la dernière recherche
+        self.nodes = 0
+        self.last_depth = 0
+        self.last_score: Optional[float] = None
+        self.last_pv: List[Tuple[Pos, MoveSeq]] = []
+        # Phases cumulées sur toutes les recherches (profile=True)
+        self.phases: Dict[str, List[float]] = {}
+
+    def choose_move_sequence(self, board: Board, turn_color: str,
+                             history: Optional[Sequence[int]] = None,
+                             quiet_plies: int = 0):
+        timers = PhaseTimers() if self.profile else None
+        move = self._choose(board, turn_color, history, quiet_plies, timers)
+        if timers is not None:
+            timers.add_to(self.phases)
+        return move
+
+    def _choose(self, board: Board, turn_color: str,
+                history: Optional[Sequence[int]], quiet_plies: int,
+                timers: Optional[PhaseTimers] = None):
+        reps = root_repetitions(board, turn_color, history)
+        if self.search == "pvs":
+            return self._search_pvs(board, turn_color, reps, quiet_plies, timers)
+
+        stats = {"nodes": 0}
+        ctx = SearchContext(evaluator=self.evaluator, timers=timers)
+        self.last_score, best = minimax(board, self.depth, -math.inf, math.inf,
+                                        turn_color, self.color, stats,
+                                        reps, quiet_plies, self.evaluator, ctx)
+        self.last_pv = [best] if best is not None else []
+        self.last_depth = self.depth
+        self.nodes = stats["nodes"]
         return best
+
+    def _search_pvs(self, board: Board, turn_color: str, reps: Dict[int, int],
+                    quiet_plies: int, timers: Optional[PhaseTimers] = None):
+        """Approfondissement itératif avec fenêtres d'aspiration."""
+        ctx = SearchContext(lmr=self.lmr, futility=self.futility,
+                            evaluator=self.evaluator, timers=timers)
+        ctx.reps = reps
+        deadline = None
+        if self.time_limit is not None:
+            deadline = time.perf_counter() + self.time_limit
+
+        score: Optional[float] = None
+        pv: List[Tuple[Pos, MoveSeq]] = []
+        self.last_depth = 0
+
+        for d in range(1, self.depth + 1):
+            if score is None or self.aspiration is None or abs(score) >= MATE:
+                alpha, beta = -math.inf, math.inf
+            else:
+                alpha, beta = score - self.aspiration, score + self.aspiration
+
+            ctx.deadline = deadline if d > 1 else None
+            try:
+                val, new_pv = pvs(board, d, alpha, beta, turn_color, ctx, pv,
+                                  quiet_plies)
+                if val <= alpha or val >= beta:
+                    # hors fenêtre : re-recherche avec la fenêtre complète
+                    val, new_pv = pvs(board, d, -math.inf, math.inf, turn_color,
+                                      ctx, new_pv, quiet_plies)
+            except SearchTimeout:
+                break
+            score, pv = val, new_pv
+            self.last_depth = d
+
+        # score du point de vue du bot, comme minimax()
+        if score is not None:
+            self.last_score = score if turn_color == self.color else -score
+        self.last_pv = pv
+        self.nodes = ctx.nodes
+        return pv[0] if pv else None
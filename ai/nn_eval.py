@@ -0,0 +1,325 @@
+"""
+Évaluation par réseau de neurones (MLP, inférence NumPy), alternative à
+evaluate() pour MinimaxBot :
+
+    MinimaxBot(WHITE, depth=5, search="pvs", weights="poids.npz")
+    python -m ai.selfplay --black minimax:depth=4,search=pvs,weights=poids.npz ...
+
+Entrée : les cases foncées de la représentation compacte (game/compact.py,
+32 en 8x8), chacune codée sur 4 neurones (pion noir, dame noire, pion blanc,
+dame blanche). Sortie : score du point de vue des noirs, dans l'unité de
+evaluate() (un pion vaut environ 1) : sigmoid(score / RESULT_SCALE) estime
+le résultat attendu des noirs.
+
+Inférence par lots : la recherche appelle prefetch() avec les fils d'un
+nœud de profondeur 1 ; un seul produit matriciel par couche les évalue
+tous, et l'appel de chaque feuille lit ensuite le résultat.
+
+Poids : fichier .npz (W0, b0, W1, b1, ...), entraînés hors ligne sur des
+parties enregistrées par ai/selfplay.py --record :
+
+    python -m ai.selfplay --black mcts:iterations=300 --white mcts:iterations=300 \\
+                          --games 200 --record parties.txt
+    python -m ai.nn_eval train parties.txt --out poids.npz
+    python -m ai.nn_eval bench poids.npz --depth 4
+
+bench compare evaluate() et le réseau : évaluations par seconde (appels
+un par un et par lots de fils), puis force de jeu sur les positions de
+ai/profiling.py (BENCH_FENS), chaque position jouée avec les deux couleurs.
+
+NumPy est une dépendance optionnelle : seul ce module l'importe, et
+ai/minimax_bot.py ne le charge que si des poids sont demandés.
+"""
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game.board import Board
+from game.piece import WHITE, BLACK
+from game.rules import Rules, DEFAULT_RULES, get_rules, VARIANTS
+from game.compact import (pack, pack_fen, BLACK_MAN, BLACK_KING,
+                          WHITE_MAN, WHITE_KING)
+
+RESULT_SCALE   = 1.5        # sigmoid(score / RESULT_SCALE) = résultat attendu
+DEFAULT_HIDDEN = (64, 32)   # tailles des couches cachées
+
+# Code d'une case compacte (0 à 6) → ses 4 entrées
+_ONE_HOT = np.zeros((7, 4), dtype=np.float32)
+for _i, _v in enumerate((BLACK_MAN, BLACK_KING, WHITE_MAN, WHITE_KING)):
+    _ONE_HOT[_v, _i] = 1.0
+
+_SWAP_COLORS = bytes.maketrans(bytes((BLACK_MAN, BLACK_KING, WHITE_MAN, WHITE_KING)),
+                               bytes((WHITE_MAN, WHITE_KING, BLACK_MAN, BLACK_KING)))
+
+
+def encode_packed(positions: Sequence[bytes]) -> np.ndarray:
+    """Positions compactes de même variante → matrice (lot, 4 × cases)."""
+    codes = np.frombuffer(b"".join(positions), dtype=np.uint8)
+    return _ONE_HOT[codes].reshape(len(positions), -1)
+
+
+def encode(boards: Sequence[Board]) -> np.ndarray:
+    return encode_packed([pack(b) for b in boards])
+
+
+def mirror(packed: bytes) -> bytes:
+    """La même position vue de l'autre camp : plateau tourné d'un demi-tour
+    (case n → case N + 1 - n), couleurs échangées."""
+    return packed[::-1].translate(_SWAP_COLORS)
+
+
+class MLPEvaluator:
+    """
+    Réseau appelable comme evaluate(board, color). layers : [(W, b)],
+    ReLU entre les couches, une sortie (score des noirs).
+
+    prefetch(boards) évalue un lot et garde les scores jusqu'au lot suivant :
+    les appels sur ces mêmes objets Board ne recalculent rien.
+    """
+
+    def __init__(self, layers: Sequence[Tuple[np.ndarray, np.ndarray]]):
+        self.layers = [(np.asarray(W, dtype=np.float32), np.asarray(b, dtype=np.float32))
+                       for W, b in layers]
+        self.n_inputs = self.layers[0][0].shape[0]
+        self._cache: Dict[int, Tuple[Board, float]] = {}
+        # Compteurs : positions évaluées, produits par le réseau (lots)
+        self.evals = 0
+        self.batches = 0
+
+    @classmethod
+    def load(cls, path: str) -> "MLPEvaluator":
+        with np.load(path) as data:
+            n = sum(1 for name in data.files if name.startswith("W"))
+            return cls([(data[f"W{i}"], data[f"b{i}"]) for i in range(n)])
+
+    def save(self, path: str) -> None:
+        arrays = {}
+        for i, (W, b) in enumerate(self.layers):
+            arrays[f"W{i}"] = W
+            arrays[f"b{i}"] = b
+        np.savez(path, **arrays)
+
+    @classmethod
+    def random(cls, n_squares: int, hidden: Sequence[int] = DEFAULT_HIDDEN,
+               seed: Optional[int] = None) -> "MLPEvaluator":
+        """Poids initiaux (He) pour l'entraînement."""
+        rng = np.random.default_rng(seed)
+        sizes = [4 * n_squares, *hidden, 1]
+        return cls([(rng.normal(0.0, np.sqrt(2.0 / a), (a, b)), np.zeros(b))
+                    for a, b in zip(sizes, sizes[1:])])
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """Scores (point de vue des noirs) d'une matrice d'entrées."""
+        if x.shape[1] != self.n_inputs:
+            raise ValueError(f"le réseau attend {self.n_inputs // 4} cases, "
+                             f"la position en a {x.shape[1] // 4}")
+        self.evals += len(x)
+        self.batches += 1
+        last = len(self.layers) - 1
+        for i, (W, b) in enumerate(self.layers):
+            x = x @ W + b
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+        return x[:, 0]
+
+    def prefetch(self, boards: Sequence[Board]) -> None:
+        if not boards:
+            self._cache = {}
+            return
+        values = self.forward(encode(boards)).tolist()
+        self._cache = {id(b): (b, v) for b, v in zip(boards, values)}
+
+    def __call__(self, board: Board, color: str) -> float:
+        entry = self._cache.get(id(board))
+        if entry is not None and entry[0] is board:
+            score = entry[1]
+        else:
+            score = float(self.forward(encode_packed([pack(board)]))[0])
+        return score if color == BLACK else -score
+
+
+# ── Entraînement hors ligne ──────────────────────────────────────────
+def read_records(path: str, rules: Optional[Rules] = None) -> Tuple[List[bytes], List[float]]:
+    """Lignes "résultat FEN" de ai/selfplay.py --record → (positions, résultats)."""
+    positions, results = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            result, fen = line.split(None, 1)
+            positions.append(pack_fen(fen, rules)[0])
+            results.append(float(result))
+    return positions, results
+
+
+def train(positions: Sequence[bytes], results: Sequence[float],
+          hidden: Sequence[int] = DEFAULT_HIDDEN, epochs: int = 20,
+          batch_size: int = 256, lr: float = 1e-3, seed: int = 0,
+          verbose: bool = True) -> MLPEvaluator:
+    """
+    Ajuste sigmoid(score / RESULT_SCALE) au résultat des noirs (entropie
+    croisée, Adam). Chaque position compte aussi en miroir (mirror(),
+    résultat 1 - r) : le réseau apprend la symétrie des deux camps.
+    """
+    x = encode_packed(list(positions) + [mirror(p) for p in positions])
+    y = np.array(list(results) + [1.0 - r for r in results], dtype=np.float32)
+    net = MLPEvaluator.random(x.shape[1] // 4, hidden, seed)
+    params = [a for layer in net.layers for a in layer]
+    m = [np.zeros_like(a) for a in params]
+    v = [np.zeros_like(a) for a in params]
+    beta1, beta2 = 0.9, 0.999
+    rng = np.random.default_rng(seed)
+    last = len(net.layers) - 1
+    step = 0
+
+    for epoch in range(epochs):
+        order = rng.permutation(len(x))
+        total = 0.0
+        for start in range(0, len(x), batch_size):
+            idx = order[start:start + batch_size]
+            yb = y[idx]
+            acts = [x[idx]]
+            for i, (W, b) in enumerate(net.layers):
+                h = acts[-1] @ W + b
+                acts.append(np.maximum(h, 0.0) if i < last else h)
+            z = acts[-1][:, 0] / RESULT_SCALE
+            # log(1 + e^-|z|) : entropie croisée sans débordement
+            total += float(np.sum(np.maximum(z, 0) - z * yb + np.log1p(np.exp(-np.abs(z)))))
+            grad = ((1.0 / (1.0 + np.exp(-z)) - yb) / (RESULT_SCALE * len(idx)))[:, None]
+
+            grads = []
+            for i in range(last, -1, -1):
+                W = net.layers[i][0]
+                grads[:0] = [acts[i].T @ grad, grad.sum(axis=0)]
+                if i:
+                    grad = (grad @ W.T) * (acts[i] > 0)
+
+            step += 1
+            for a, g, ma, va in zip(params, grads, m, v):
+                ma *= beta1
+                ma += (1 - beta1) * g
+                va *= beta2
+                va += (1 - beta2) * g * g
+                a -= (lr * (ma / (1 - beta1 ** step))
+                      / (np.sqrt(va / (1 - beta2 ** step)) + 1e-8)).astype(a.dtype)
+        if verbose:
+            print(f"époque {epoch + 1}/{epochs} : perte {total / len(x):.4f}")
+    return net
+
+
+# ── Banc d'essai ─────────────────────────────────────────────────────
+def _sibling_sets(fens: Sequence[str], rules: Rules) -> List[List[Board]]:
+    """Fils de chaque position et de chacun de ses fils : les lots que voit
+    prefetch() à la profondeur 1."""
+    from game.notation import parse_fen
+    from ai.minimax_bot import generate_all_turn_moves, opponent
+    sets = []
+    for fen in fens:
+        board, turn = parse_fen(fen, rules)
+        children = generate_all_turn_moves(board, turn)
+        sets.append([b2 for b2, _, _ in children])
+        for b2, _, _ in children:
+            grandchildren = generate_all_turn_moves(b2, opponent(turn))
+            if grandchildren:
+                sets.append([b3 for b3, _, _ in grandchildren])
+    return sets
+
+
+def bench_speed(net: MLPEvaluator, fens: Sequence[str],
+                rules: Rules = DEFAULT_RULES, repeat: int = 3) -> Dict[str, float]:
+    """Évaluations par seconde : evaluate(), réseau un par un, réseau par lots."""
+    from ai.minimax_bot import evaluate
+    sets = _sibling_sets(fens, rules)
+    boards = [b for s in sets for b in s]
+
+    def rate(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        return round(len(boards) / best)
+
+    def batched():
+        for s in sets:
+            net.prefetch(s)
+            for b in s:
+                net(b, BLACK)
+
+    hand = rate(lambda: [evaluate(b, BLACK) for b in boards])
+    net.prefetch([])
+    single = rate(lambda: [net(b, BLACK) for b in boards])
+    batch = rate(batched)
+    return {"positions": len(boards), "lots": len(sets), "evaluate_par_s": hand,
+            "mlp_unitaire_par_s": single, "mlp_lots_par_s": batch}
+
+
+def bench_strength(weights: str, depth: int = 4, fens: Optional[Dict[str, str]] = None,
+                   rules: Rules = DEFAULT_RULES, verbose: bool = True) -> dict:
+    """Réseau contre evaluate(), même recherche (PVS), depuis chaque position
+    avec les deux couleurs. Score du point de vue du réseau."""
+    from game.game import Game
+    from game.piece import DRAW
+    from ai.minimax_bot import MinimaxBot
+    from ai.profiling import BENCH_FENS
+    from ai.selfplay import play_game
+
+    net = MLPEvaluator.load(weights)
+    score, games, cpu = 0.0, 0, {"mlp": 0.0, "evaluate": 0.0}
+    for name, fen in (fens or BENCH_FENS).items():
+        for net_color in (BLACK, WHITE):
+            bots = {color: MinimaxBot(color, depth=depth, search="pvs",
+                                      evaluator=net if color == net_color else None)
+                    for color in (BLACK, WHITE)}
+            winner, spent, plies = play_game(bots[BLACK], bots[WHITE],
+                                             game=Game.from_fen(fen, rules))
+            other = WHITE if net_color == BLACK else BLACK
+            cpu["mlp"] += spent[net_color]
+            cpu["evaluate"] += spent[other]
+            games += 1
+            if winner == DRAW:
+                score += 0.5
+            elif winner == net_color:
+                score += 1.0
+            if verbose:
+                print(f"{name}: réseau={net_color} vainqueur={winner} ({plies} demi-coups)")
+    return {"parties": games, "score_mlp": score, "score_evaluate": games - score,
+            "cpu_mlp": round(cpu["mlp"], 2), "cpu_evaluate": round(cpu["evaluate"], 2)}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Évaluation par réseau de neurones (MLP NumPy)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    tr = sub.add_parser("train", help="entraîne un réseau sur des parties enregistrées")
+    tr.add_argument("records", help="fichier de ai/selfplay.py --record")
+    tr.add_argument("--out", required=True, help="fichier .npz des poids")
+    tr.add_argument("--hidden", default=",".join(map(str, DEFAULT_HIDDEN)),
+                    help="tailles des couches cachées, séparées par des virgules")
+    tr.add_argument("--epochs", type=int, default=20)
+    tr.add_argument("--batch-size", type=int, default=256)
+    tr.add_argument("--lr", type=float, default=1e-3)
+    tr.add_argument("--seed", type=int, default=0)
+    tr.add_argument("--variant", default=DEFAULT_RULES.name, choices=list(VARIANTS))
+
+    be = sub.add_parser("bench", help="vitesse et force de jeu contre evaluate()")
+    be.add_argument("weights", help="fichier .npz des poids")
+    be.add_argument("--depth", type=int, default=4)
+    be.add_argument("--no-games", action="store_true", help="vitesse seulement")
+
+    args = ap.parse_args()
+    if args.command == "train":
+        rules = get_rules(args.variant)
+        positions, results = read_records(args.records, rules)
+        print(f"{len(positions)} positions")
+        net = train(positions, results, [int(n) for n in args.hidden.split(",")],
+                    args.epochs, args.batch_size, args.lr, args.seed)
+        net.save(args.out)
+    else:
+        from ai.profiling import BENCH_FENS
+        print(bench_speed(MLPEvaluator.load(args.weights), list(BENCH_FENS.values())))
+        if not args.no_games:
+            print(bench_strength(args.weights, args.depth))
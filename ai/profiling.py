@@ -0,0 +1,199 @@
+"""
+Profilage de MinimaxBot sur une suite fixe de positions de référence.
+
+    python -m ai.profiling --depth 5 --search pvs
+    python -m ai.profiling --depth 4 --memory --top 15 --sort tottime
+
+Affiche, pour toute la suite :
+- les compteurs par phase (génération de coups, clones, évaluation, test
+  de fin de partie) des bots profilés, voir PhaseTimers ;
+- le rapport cProfile par fonction ;
+- avec --memory, le pic mémoire et les sites d'allocation qui retiennent
+  le plus de mémoire (tracemalloc).
+
+profiled() s'utilise aussi autour de n'importe quel code (voir ai/selfplay.py
+--profile) : cProfile et tracemalloc couvrent tout le bloc, les compteurs par
+phase sont ceux que l'appelant ajoute à report.phases (add_phases), pris
+sur des bots créés avec profile=True.
+
+    python -m ai.profiling --imports
+
+mesure le temps d'import des modules du projet, chacun dans un interpréteur
+neuf (c'est ce que paie chaque processus d'un pool), et signale ceux qui
+chargent pygame : game, ai et server doivent rester sans pygame.
+"""
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from game.notation import parse_fen
+from ai.minimax_bot import MinimaxBot, add_phases
+
+# Suite fixe : toujours les mêmes positions, pour comparer deux versions
+BENCH_FENS = {
+    "ouverture":   "B:W21-32:B1-12",
+    "debut":       "B:W15,17,21,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,16",
+    "milieu":      "W:W18,22,23,25,27,28,29,31,32:B1,2,4,5,9,11,14,16,20",
+    "rafles":      "B:W18,27,28,29,31,32:B1,2,4,5,9,15,K16,20",
+    "dames":       "W:W14,17,21,23,K27,28,29:B11,16,20",
+    "finale":      "B:WK3,K30:B6,K18",
+}
+
+IMPORT_MODULES = [
+    "game.game", "game.compact", "ai.minimax_bot", "ai.mcts_bot", "ai.selfplay", "ai.nn_eval",
+    "ai.analysis", "server.game_server", "ui.layout", "ui.thumbnails", "main",
+    "ui.renderer",
+]
+
+# Une dépendance optionnelle absente (NumPy pour ai.nn_eval, pygame pour
+# ui.renderer) est signalée par "absent <module>" au lieu d'un échec
+_IMPORT_PROBE = ("import sys, time\n"
+                 "t = time.perf_counter()\n"
+                 "try:\n"
+                 "    import {0}\n"
+                 "except ModuleNotFoundError as exc:\n"
+                 "    print('absent', exc.name)\n"
+                 "else:\n"
+                 "    print(time.perf_counter() - t, 'pygame' in sys.modules)")
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProfileReport:
+    """Résultats de profiled() : phases, cProfile et tracemalloc."""
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}
+        self.profiler: Optional[cProfile.Profile] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.peak_memory = 0   # octets, pic pendant le bloc (tracemalloc)
+        self.wall = 0.0
+
+    def format(self, top: int = 25, sort: str = "cumulative") -> str:
+        out = [f"durée : {self.wall:.2f} s", "", format_phases(self.phases, self.wall)]
+        if self.profiler is not None:
+            buf = io.StringIO()
+            pstats.Stats(self.profiler, stream=buf).sort_stats(sort).print_stats(top)
+            out += ["", f"cProfile ({sort}, {top} premières fonctions) :", buf.getvalue()]
+        if self.snapshot is not None:
+            out += ["", f"tracemalloc : pic {self.peak_memory / 1024:.0f} Kio, "
+                        f"{top} premiers sites encore alloués :"]
+            for stat in self.snapshot.statistics("lineno")[:top]:
+                out.append(f"  {stat}")
+        return "\n".join(out)
+
+
+def format_phases(phases: Dict[str, List[float]], wall: float = 0.0) -> str:
+    lines = ["phase          appels   secondes   µs/appel   % durée"]
+    for phase, (calls, seconds) in phases.items():
+        per_call = seconds / calls * 1e6 if calls else 0.0
+        share = 100.0 * seconds / wall if wall else 0.0
+        lines.append(f"{phase:<12} {calls:>8} {seconds:>10.3f} {per_call:>10.1f} {share:>8.1f}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiled(cpu: bool = True, memory: bool = False) -> Iterator[ProfileReport]:
+    """
+    Profile le bloc : cProfile si cpu, tracemalloc si memory (nettement plus
+    lent). Le rapport est complet à la sortie du bloc ; report.phases reçoit
+    les compteurs par phase que le bloc y ajoute.
+    """
+    report = ProfileReport()
+    if memory:
+        tracemalloc.start()
+    if cpu:
+        report.profiler = cProfile.Profile()
+    t0 = time.perf_counter()
+    if report.profiler is not None:
+        report.profiler.enable()
+    try:
+        yield report
+    finally:
+        if report.profiler is not None:
+            report.profiler.disable()
+        report.wall = time.perf_counter() - t0
+        if memory:
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+            report.snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+
+def run_suite(depth: int = 5, search: str = "pvs", fens: Optional[Dict[str, str]] = None,
+              verbose: bool = True, phases: Optional[Dict[str, List[float]]] = None,
+              **bot_kwargs) -> List[dict]:
+    """Une recherche par position de la suite ; retourne les statistiques.
+    phases : reçoit les compteurs par phase des recherches (bots profilés)."""
+    results = []
+    for name, fen in (fens or BENCH_FENS).items():
+        board, turn = parse_fen(fen)
+        bot = MinimaxBot(turn, depth=depth, search=search,
+                         profile=phases is not None, **bot_kwargs)
+        t0 = time.perf_counter()
+        bot.choose_move_sequence(board, turn)
+        if phases is not None:
+            add_phases(phases, bot.phases)
+        row = {"position": name, "nodes": bot.nodes,
+               "seconds": round(time.perf_counter() - t0, 4)}
+        results.append(row)
+        if verbose:
+            print(row)
+    return results
+
+
+def import_time(module: str, repeat: int = 5) -> Tuple[float, bool]:
+    """(meilleur temps d'import en secondes, pygame chargé ?) dans un
+    interpréteur neuf, lancé `repeat` fois. ImportError si une dépendance
+    optionnelle du module n'est pas installée."""
+    best, loads_pygame = float("inf"), False
+    env = dict(os.environ, PYTHONPATH=_ROOT, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(module)],
+                             cwd=_ROOT, env=env, capture_output=True, text=True,
+                             check=True).stdout.split()
+        if out[0] == "absent":
+            raise ImportError(f"{module} : {out[1]} n'est pas installé", name=out[1])
+        best = min(best, float(out[0]))
+        loads_pygame = out[1] == "True"
+    return best, loads_pygame
+
+
+def format_import_times(modules: Optional[List[str]] = None, repeat: int = 5) -> str:
+    lines = ["module                 import (ms)   pygame"]
+    for module in modules or IMPORT_MODULES:
+        try:
+            seconds, loads_pygame = import_time(module, repeat)
+        except ImportError as exc:
+            lines.append(f"{module:<22} indisponible ({exc.name} absent)")
+            continue
+        lines.append(f"{module:<22} {seconds * 1000:>11.1f}   {'oui' if loads_pygame else 'non'}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Profilage de MinimaxBot sur la suite de référence")
+    ap.add_argument("--depth", type=int, default=5)
+    ap.add_argument("--search", default="pvs", choices=("alphabeta", "pvs"))
+    ap.add_argument("--memory", action="store_true", help="ajoute tracemalloc")
+    ap.add_argument("--no-cprofile", action="store_true")
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--sort", default="cumulative",
+                    help="clé de tri pstats (cumulative, tottime, ncalls...)")
+    ap.add_argument("--imports", action="store_true",
+                    help="temps d'import des modules (interpréteurs neufs)")
+    args = ap.parse_args()
+
+    if args.imports:
+        print(format_import_times())
+        sys.exit(0)
+
+    with profiled(cpu=not args.no_cprofile, memory=args.memory) as report:
+        run_suite(args.depth, args.search, phases=report.phases)
+    print(report.format(args.top, args.sort))
@@ -0,0 +1,208 @@
+"""
+Parties bot contre bot pour comparer les moteurs (force par seconde CPU).
+
+    python -m ai.selfplay --black minimax:depth=5,search=pvs \\
+                          --white mcts:time_limit=0.5 --games 10
+
+Spécification d'un bot : "minimax" ou "mcts", suivi éventuellement de ":"
+et d'options clé=valeur séparées par des virgules (arguments du constructeur).
+Les couleurs sont alternées d'une partie à l'autre. Le temps CPU compté
+inclut celui des processus des pools de MCTSBot (worker_cpu) ; chaque bot
+est créé une fois par couleur pour tout le match, son pool aussi.
+--variant choisit les règles (game/rules.py : classique, internationale,
+anglaise).
+
+--record FICHIER ajoute au fichier chaque position des parties terminées,
+une ligne "résultat FEN" (résultat des noirs : 1, 0.5 ou 0) : données
+d'entraînement de l'évaluation par réseau (ai/nn_eval.py).
+
+--profile profile le match (compteurs par phase des MinimaxBot et cProfile,
+voir ai/profiling.py) ; --profile-memory ajoute tracemalloc. Seules les
+recherches du processus courant sont mesurées (pas les pools de MCTSBot).
+
+Les parties se terminent toujours : les coups irréversibles (prises,
+mouvements de pion) sont en nombre fini, et entre deux d'entre eux
+Game.winner() déclare la nulle après DRAW_QUIET_PLIES demi-coups. Chaque
+partie a donc un vainqueur ou DRAW ; max_game_plies() (game/game.py) borne
+sa longueur, et la dépasser lève une erreur (--max-plies la remplace).
+"""
+import argparse
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game.game import Game, max_game_plies
+from game.piece import WHITE, BLACK, DRAW
+from game.rules import DEFAULT_RULES, Rules, get_rules, VARIANTS
+from ai.minimax_bot import MinimaxBot, add_phases
+from ai.mcts_bot import MCTSBot
+
+BOT_TYPES: Dict[str, Callable] = {"minimax": MinimaxBot, "mcts": MCTSBot}
+
+
+def _parse_value(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    if text in ("None", "none"):
+        return None
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    return text
+
+
+def make_bot(spec: str, color: str):
+    """"mcts:time_limit=0.5,workers=2" → MCTSBot(color, time_limit=0.5, workers=2)"""
+    name, _, opts = spec.partition(":")
+    if name not in BOT_TYPES:
+        raise ValueError(f"bot inconnu : {name!r} (choix : {', '.join(BOT_TYPES)})")
+    kwargs = {}
+    for item in filter(None, opts.split(",")):
+        key, _, value = item.partition("=")
+        kwargs[key.strip()] = _parse_value(value.strip())
+    return BOT_TYPES[name](color, **kwargs)
+
+
+def cpu_seconds() -> float:
+    t = os.times()
+    return t.user + t.system
+
+
+def bot_cpu_seconds(bot) -> float:
+    """CPU du processus courant plus celui des processus du bot (MCTSBot)."""
+    return cpu_seconds() + getattr(bot, "worker_cpu", 0.0)
+
+
+def play_turn(game: Game, start, seq) -> None:
+    game.select(*start)
+    for to in seq:
+        game.move_selected(*to)
+
+
+def play_game(black, white, max_plies: Optional[int] = None,
+              game: Optional[Game] = None, fens: Optional[List[str]] = None
+              ) -> Tuple[str, Dict[str, float], int]:
+    """Joue une partie jusqu'au bout ; retourne (vainqueur ou DRAW, CPU par
+    couleur, demi-coups). fens : reçoit la FEN de chaque position où un camp
+    doit jouer. max_plies : garde-fou, max_game_plies() de la variante par
+    défaut ; RuntimeError s'il est atteint (règles de nulle défaillantes)."""
+    game = game or Game()
+    if max_plies is None:
+        max_plies = max_game_plies(game.rules)
+    bots = {BLACK: black, WHITE: white}
+    cpu = {BLACK: 0.0, WHITE: 0.0}
+
+    for ply in range(max_plies):
+        winner = game.winner()
+        if winner is not None:
+            return winner, cpu, ply
+        if fens is not None:
+            fens.append(game.to_fen())
+        color = game.turn
+        t0 = bot_cpu_seconds(bots[color])
+        move = bots[color].choose_move_sequence(game.board, color, game.history,
+                                                game.quiet_plies)
+        cpu[color] += bot_cpu_seconds(bots[color]) - t0
+        if move is None:
+            return (WHITE if color == BLACK else BLACK), cpu, ply
+        play_turn(game, *move)
+
+    winner = game.winner()
+    if winner is None:
+        raise RuntimeError(f"partie non terminée après {max_plies} demi-coups : "
+                           f"{game.to_fen()}")
+    return winner, cpu, max_plies
+
+
+def record_game(path: str, fens: List[str], winner: str) -> None:
+    """Ajoute les positions d'une partie terminée au fichier d'enregistrement."""
+    result = "0.5" if winner == DRAW else ("1" if winner == BLACK else "0")
+    with open(path, "a", encoding="utf-8") as f:
+        for fen in fens:
+            f.write(f"{result} {fen}\n")
+
+
+def run_match(spec_a: str, spec_b: str, games: int,
+              max_plies: Optional[int] = None, verbose: bool = True,
+              rules: Rules = DEFAULT_RULES, record: Optional[str] = None,
+              phases: Optional[Dict[str, List[float]]] = None) -> dict:
+    """Match de `games` parties entre deux bots, couleurs alternées,
+    dans la variante `rules`. record : fichier d'enregistrement des
+    positions (voir record_game). phases : reçoit les compteurs par phase
+    des MinimaxBot, alors profilés (voir ai/profiling.py)."""
+    score = {"a": 0.0, "b": 0.0}
+    cpu = {"a": 0.0, "b": 0.0}
+    made: Dict[Tuple[str, str], object] = {}
+
+    def bot(side: str, spec: str, color: str):
+        if (side, color) not in made:
+            made[side, color] = make_bot(spec, color)
+            if phases is not None and isinstance(made[side, color], MinimaxBot):
+                made[side, color].profile = True
+        return made[side, color]
+
+    try:
+        for i in range(games):
+            a_color = BLACK if i % 2 == 0 else WHITE
+            b_color = WHITE if a_color == BLACK else BLACK
+            bots = {a_color: bot("a", spec_a, a_color), b_color: bot("b", spec_b, b_color)}
+            fens: Optional[List[str]] = [] if record else None
+            winner, spent, plies = play_game(bots[BLACK], bots[WHITE], max_plies,
+                                             Game(rules=rules), fens)
+            if record:
+                record_game(record, fens, winner)
+            cpu["a"] += spent[a_color]
+            cpu["b"] += spent[b_color]
+            if winner == DRAW:
+                score["a"] += 0.5
+                score["b"] += 0.5
+            else:
+                score["a" if winner == a_color else "b"] += 1
+            if verbose:
+                print(f"partie {i + 1}: A={a_color} vainqueur={winner} ({plies} demi-coups)")
+    finally:
+        for b in made.values():
+            if phases is not None and isinstance(b, MinimaxBot):
+                add_phases(phases, b.phases)
+            close = getattr(b, "close", None)
+            if close is not None:
+                close()
+
+    return {
+        "a": spec_a, "b": spec_b, "games": games, "variant": rules.name,
+        "score_a": score["a"], "score_b": score["b"],
+        "cpu_a": round(cpu["a"], 2), "cpu_b": round(cpu["b"], 2),
+        "points_per_cpu_s_a": round(score["a"] / cpu["a"], 4) if cpu["a"] else None,
+        "points_per_cpu_s_b": round(score["b"] / cpu["b"], 4) if cpu["b"] else None,
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Match bot contre bot")
+    ap.add_argument("--black", default="minimax:depth=4,search=pvs",
+                    help="bot A (noirs à la première partie)")
+    ap.add_argument("--white", default="mcts:time_limit=0.5",
+                    help="bot B")
+    ap.add_argument("--games", type=int, default=2)
+    ap.add_argument("--max-plies", type=int, default=None,
+                    help="garde-fou (défaut : borne de la variante, max_game_plies)")
+    ap.add_argument("--variant", default=DEFAULT_RULES.name, choices=list(VARIANTS))
+    ap.add_argument("--record", metavar="FICHIER",
+                    help="enregistre les positions des parties terminées")
+    ap.add_argument("--profile", action="store_true",
+                    help="compteurs par phase et rapport cProfile")
+    ap.add_argument("--profile-memory", action="store_true",
+                    help="avec --profile : ajoute tracemalloc")
+    ap.add_argument("--top", type=int, default=25)
+    args = ap.parse_args()
+    if not args.profile:
+        print(run_match(args.black, args.white, args.games, args.max_plies,
+                        rules=get_rules(args.variant), record=args.record))
+    else:
+        from ai.profiling import profiled
+        with profiled(memory=args.profile_memory) as report:
+            print(run_match(args.black, args.white, args.games, args.max_plies,
+                            rules=get_rules(args.variant), record=args.record,
+                            phases=report.phases))
+        print(report.format(args.top))
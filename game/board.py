@@ -1,24 +1,32 @@
+from typing import Optional
+
 from game.piece import Piece, WHITE, BLACK
+from game.rules import Rules, DEFAULT_RULES, ALL_DIRS
 
-ROWS, COLS = 8, 8
+# Taille du plateau de la variante par défaut (interface graphique)
+ROWS = COLS = DEFAULT_RULES.size
 
 
 class Board:
-    def __init__(self):
-        # Grille 8x8 : None = case vide, Piece = pion/dame
-        self.grid = [[None for _ in range(COLS)] for _ in range(ROWS)]
-        self.create_board()
+    def __init__(self, setup: bool = True, rules: Optional[Rules] = None):
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        size = self.rules.size
+        # Grille size x size : None = case vide, Piece = pion/dame
+        self.grid = [[None] * size for _ in range(size)]
+        # setup=False : plateau vide (copies, positions chargées depuis un texte)
+        if setup:
+            self.create_board()
 
     def create_board(self) -> None:
-        """Place les 12 pions noirs (haut) et 12 pions blancs (bas) sur cases foncées."""
-        for row in range(ROWS):
-            for col in range(COLS):
-                # On ne place que sur les cases foncées
-                if (row + col) % 2 == 1:
-                    if row < 3:          # lignes 0,1,2 : noirs
-                        self.grid[row][col] = Piece(row, col, BLACK)
-                    elif row > 4:        # lignes 5,6,7 : blancs
-                        self.grid[row][col] = Piece(row, col, WHITE)
+        """Place les pions noirs (haut) et blancs (bas) sur les cases foncées
+        des rules.rows_of_men premières et dernières rangées."""
+        n = self.rules.rows_of_men
+        size = self.rules.size
+        for row, col in self.rules.dark_squares:
+            if row < n:
+                self.grid[row][col] = Piece(row, col, BLACK)
+            elif row >= size - n:
+                self.grid[row][col] = Piece(row, col, WHITE)
 
     def get_piece(self, row: int, col: int):
         """Retourne la pièce présente sur (row, col) ou None."""
@@ -36,9 +44,7 @@ class Board:
         piece.move_to(row, col)
 
         # 4) Promotion en dame
-        if piece.color == WHITE and row == 0:
-            piece.make_king()
-        elif piece.color == BLACK and row == ROWS - 1:
+        if row == self.rules.promotion_row[piece.color]:
             piece.make_king()
 
     def remove(self, pieces) -> None:
@@ -56,9 +62,10 @@ class Board:
                 continue
 
             # Sécurité : on vérifie que la pièce est bien à cet endroit
+            size = self.rules.size
             if (
-                0 <= piece.row < ROWS
-                and 0 <= piece.col < COLS
+                0 <= piece.row < size
+                and 0 <= piece.col < size
                 and self.grid[piece.row][piece.col] is piece
             ):
                 self.grid[piece.row][piece.col] = None
@@ -67,82 +74,65 @@ class Board:
         """Retourne les coups valides pour une pièce.
         Format: {(row, col): [pieces_capturées]}
         """
-        moves = {}
-        row, col = piece.row, piece.col
-
-        # =========================
-        # CAS DAME
-        # =========================
+        rules = self.rules
         if piece.is_king:
-            directions = [
-                (-1, -1), (-1, 1),
-                (1, -1),  (1, 1)
-            ]
-
-            for d_row, d_col in directions:
-                r, c = row + d_row, col + d_col
-                captured = None
-
-                while 0 <= r < ROWS and 0 <= c < COLS:
-                    target = self.grid[r][c]
-
-                    # Case vide -> déplacement possible (avec ou sans capture)
-                    if target is None:
-                        moves[(r, c)] = [] if captured is None else [captured]
-
-                    # Pièce alliée -> bloqué
-                    elif target.color == piece.color:
-                        break
-
-                    # Pièce ennemie
-                    else:
-                        if captured is not None:
-                            break  # déjà capturé dans cette direction
-                        captured = target
-
-                    r += d_row
-                    c += d_col
-
-            return moves
-
-                  # =========================
-        # CAS PION (déplacement avant, capture avant)
-        # =========================
-
-        # déplacements simples (avant)
-        if piece.color == WHITE:
-            move_dirs = [(-1, -1), (-1, 1)]
-        else:  # BLACK
-            move_dirs = [(1, -1), (1, 1)]
-
-        # captures (avant ET arrière — règle enchaînement)
-        capture_dirs = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+            if rules.flying_kings:
+                return self._flying_king_moves(piece)
+            return self._step_moves(piece, ALL_DIRS, ALL_DIRS)
+        return self._step_moves(piece, rules.man_dirs[piece.color],
+                                rules.man_capture_dirs[piece.color])
+
+    def _flying_king_moves(self, piece: Piece):
+        """Dame volante : glisse sur toute la diagonale, prend à distance
+        une pièce ennemie et peut s'arrêter sur n'importe quelle case libre
+        derrière."""
+        moves = {}
+        grid = self.grid
+        color = piece.color
+        for ray in self.rules.rays[piece.row][piece.col]:
+            captured = None
+            for pos in ray:
+                target = grid[pos[0]][pos[1]]
+
+                # Case vide -> déplacement possible (avec ou sans capture)
+                if target is None:
+                    moves[pos] = [] if captured is None else [captured]
+
+                # Pièce alliée, ou deuxième pièce ennemie -> bloqué
+                elif target.color == color or captured is not None:
+                    break
+
+                # Première pièce ennemie
+                else:
+                    captured = target
+        return moves
+
+    def _step_moves(self, piece: Piece, step_dirs, capture_dirs):
+        """Pion (ou dame courte) : un pas dans step_dirs, prise par saut
+        d'une pièce adjacente dans capture_dirs."""
+        moves = {}
+        grid = self.grid
+        rays = self.rules.rays[piece.row][piece.col]
 
         # 1) Déplacements simples
-        for d_row, d_col in move_dirs:
-            new_row = row + d_row
-            new_col = col + d_col
-            if 0 <= new_row < ROWS and 0 <= new_col < COLS:
-                if self.grid[new_row][new_col] is None:
-                    moves[(new_row, new_col)] = []
+        for d in step_dirs:
+            ray = rays[d]
+            if ray:
+                r, c = ray[0]
+                if grid[r][c] is None:
+                    moves[ray[0]] = []
 
         # 2) Captures
-        for d_row, d_col in capture_dirs:
-            mid_row = row + d_row
-            mid_col = col + d_col
-            land_row = row + 2 * d_row
-            land_col = col + 2 * d_col
-
-            if (
-                0 <= mid_row < ROWS and 0 <= mid_col < COLS
-                and 0 <= land_row < ROWS and 0 <= land_col < COLS
-            ):
-                mid_piece = self.grid[mid_row][mid_col]
+        for d in capture_dirs:
+            ray = rays[d]
+            if len(ray) >= 2:
+                (mr, mc), land = ray[0], ray[1]
+                mid_piece = grid[mr][mc]
                 if (
                     mid_piece is not None
                     and mid_piece.color != piece.color
-                    and self.grid[land_row][land_col] is None
+                    and grid[land[0]][land[1]] is None
                 ):
-                    moves[(land_row, land_col)] = [mid_piece]
+                    moves[land] = [mid_piece]
 
-        return moves
\ No newline at end of file
+        return moves
@@ -0,0 +1,101 @@
+"""
+Prise majoritaire : recherche des rafles qui prennent le plus de pièces.
+
+Dans les variantes où Rules.max_capture est vrai, seule une rafle qui prend
+le plus grand nombre de pièces est autorisée. max_capture_chains() explore
+les rafles de toutes les pièces du camp par séparation et évaluation : une
+branche est abandonnée dès que les prises déjà faites plus les pièces encore
+prenables ne peuvent plus égaler le meilleur total trouvé. Les rafles plus
+courtes ne sont donc pas énumérées jusqu'au bout puis filtrées.
+
+Majorant des pièces encore prenables :
+- seule une pièce sur une case intérieure (Rules.interior) peut être prise ;
+- une pièce qui prend par saut (pion, dame courte) retombe toujours sur une
+  rangée de même parité : elle ne prend que des pièces des rangées de
+  l'autre parité. Un pion qui peut devenir dame volante en cours de rafle
+  (rangée de même parité que sa rangée de promotion) n'a pas cette limite.
+
+Utilisé par Game (interface, pas à pas) et par ai/minimax_bot.py ; la
+représentation compacte a son équivalent (game/compact.py).
+"""
+from typing import List, Tuple
+
+from game.board import Board
+from game.piece import Piece
+
+Pos = Tuple[int, int]
+Chain = Tuple[Pos, List[Pos], List[Pos]]   # (départ, arrivées, cases prises)
+
+
+def max_capture_chains(board: Board, color: str) -> Tuple[int, List[Chain]]:
+    """
+    (nombre maximal de prises, rafles qui l'atteignent) pour le camp color,
+    (0, []) s'il n'y a aucune prise. Toutes les rafles maximales sont
+    rendues, même celles qui mènent à la même position par des chemins
+    différents : l'interface doit accepter chacun d'eux. Les rafles sont
+    parcourues sur le plateau reçu (make/unmake), restauré à la fin.
+    """
+    rules = board.rules
+    grid = board.grid
+    flying = rules.flying_kings
+
+    # Pièces adverses prenables, par parité de rangée
+    enemy = [0, 0]
+    for r, c in rules.interior:
+        p = grid[r][c]
+        if p is not None and p.color != color:
+            enemy[r % 2] += 1
+
+    best = [1]          # une rafle prend au moins une pièce
+    chains: List[Chain] = []
+    path: List[Pos] = []
+    taken: List[Pos] = []
+    start: Pos = (0, 0)
+
+    def bound(piece: Piece) -> int:
+        row = piece.row
+        if flying and (piece.is_king
+                       or row % 2 == rules.promotion_row[piece.color] % 2):
+            return enemy[0] + enemy[1]
+        return enemy[1 - row % 2]
+
+    def walk(piece: Piece) -> None:
+        if len(taken) + bound(piece) < best[0]:
+            return
+        moves = [(to, caps) for to, caps in board.get_valid_moves(piece).items() if caps]
+        if not moves:
+            n = len(taken)
+            if n >= best[0]:
+                if n > best[0]:
+                    best[0] = n
+                    chains.clear()
+                chains.append((start, list(path), list(taken)))
+            return
+
+        fr, fc = piece.row, piece.col
+        was_king = piece.is_king
+        for to, captured in moves:
+            board.move(piece, *to)
+            for p in captured:
+                grid[p.row][p.col] = None
+                enemy[p.row % 2] -= 1
+                taken.append((p.row, p.col))
+            path.append(to)
+            walk(piece)
+            path.pop()
+            for p in captured:
+                grid[p.row][p.col] = p
+                enemy[p.row % 2] += 1
+                taken.pop()
+            grid[to[0]][to[1]] = None
+            grid[fr][fc] = piece
+            piece.move_to(fr, fc)
+            piece.is_king = was_king
+
+    for r, row in enumerate(grid):
+        for c, p in enumerate(row):
+            if p is not None and p.color == color:
+                start = (r, c)
+                walk(p)
+
+    return (best[0], chains) if chains else (0, [])
@@ -0,0 +1,407 @@
+"""
+Représentation compacte des positions et génération de coups sans objets.
+
+Une position tient dans 32 octets (bytes), un par case foncée dans l'ordre
+de la notation (case n de game/notation.py → indice n - 1) ; 50 octets pour
+les variantes en 10x10 (game/rules.py) :
+
+    EMPTY = 0, BLACK_MAN = 1, BLACK_KING = 2, WHITE_MAN = 5, WHITE_KING = 6
+    (bit 4 = blanc, bit 2 = dame)
+
+legal_moves() suit exactement les règles de Board.get_valid_moves et de
+generate_all_turn_moves (prise obligatoire, pions qui prennent en arrière,
+dames volantes, promotion en cours de rafle, chaînes équivalentes dédoublées,
+prise majoritaire avec le même majorant que game/captures.py),
+sans construire ni Game, ni Board, ni Piece. Chaque variante a ses tables
+(Geometry, calculées une fois) ; les fonctions prennent un paramètre rules
+optionnel, la variante classique par défaut. batch_legal_moves() traite des
+lots de positions, éventuellement sur un pool de processus, et renvoie les
+coups encodés en octets : pour chaque coup, la longueur du chemin puis les
+indices des cases (départ, arrivées successives).
+"""
+from functools import partial
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from game.board import Board
+from game.piece import Piece, WHITE, BLACK
+from game.rules import Rules, DEFAULT_RULES, ALL_DIRS
+from game.notation import parse_fen
+
+EMPTY, BLACK_MAN, BLACK_KING, WHITE_MAN, WHITE_KING = 0, 1, 2, 5, 6
+WHITE_BIT, KING_BIT = 4, 2
+
+Path = Tuple[int, ...]
+Position = Union[str, Tuple[bytes, str]]   # FEN, ou (octets, camp au trait)
+
+
+class Geometry:
+    """Tables d'une variante, en indices de cases foncées (0 à n - 1)."""
+
+    def __init__(self, rules: Rules):
+        self.rules = rules
+        self.n = rules.n_squares
+        self.squares = rules.dark_squares
+        index = {pos: i for i, pos in enumerate(self.squares)}
+        # rays[sq][d] : cases traversées depuis sq dans la direction d
+        # (0 = haut-gauche, 1 = haut-droite, 2 = bas-gauche, 3 = bas-droite)
+        self.rays: List[Tuple[Path, ...]] = [
+            tuple(tuple(index[p] for p in ray) for ray in rules.rays[r][c])
+            for r, c in self.squares]
+        self.flying = rules.flying_kings
+        # Par type de pièce et par case, spécialisés pour la variante :
+        # steps[v][sq]        cases d'un déplacement simple (hors dame volante)
+        # capture_rays[v][sq] rayons d'au moins 2 cases où une prise par saut
+        #                     est possible (hors dame volante)
+        step_dirs = {BLACK_MAN: rules.man_dirs[BLACK], WHITE_MAN: rules.man_dirs[WHITE],
+                     BLACK_KING: ALL_DIRS, WHITE_KING: ALL_DIRS}
+        capture_dirs = {BLACK_MAN: rules.man_capture_dirs[BLACK],
+                        WHITE_MAN: rules.man_capture_dirs[WHITE],
+                        BLACK_KING: ALL_DIRS, WHITE_KING: ALL_DIRS}
+        self.steps = {v: [tuple(rays[d][0] for d in dirs if rays[d]) for rays in self.rays]
+                      for v, dirs in step_dirs.items()}
+        self.capture_rays = {v: [tuple(rays[d] for d in dirs if len(rays[d]) >= 2)
+                                 for rays in self.rays]
+                             for v, dirs in capture_dirs.items()}
+        # Cases de promotion par type de pion
+        self.promotion = {
+            BLACK_MAN: frozenset(i for i, (r, _) in enumerate(self.squares)
+                                 if r == rules.promotion_row[BLACK]),
+            WHITE_MAN: frozenset(i for i, (r, _) in enumerate(self.squares)
+                                 if r == rules.promotion_row[WHITE]),
+        }
+        # Prise majoritaire : parité de rangée des cases, cases intérieures
+        # (seules prenables) et parité de la rangée de promotion par pion
+        self.max_capture = rules.max_capture
+        self.parity = [r % 2 for r, _ in self.squares]
+        self.interior = [pos in rules.interior for pos in self.squares]
+        self.promotion_parity = {BLACK_MAN: rules.promotion_row[BLACK] % 2,
+                                 WHITE_MAN: rules.promotion_row[WHITE] % 2}
+        # Jeton FEN ("7", "K7") → (indice, dame)
+        self.fen_tokens = {}
+        for i in range(self.n):
+            self.fen_tokens[str(i + 1)] = (i, False)
+            self.fen_tokens["K" + str(i + 1)] = (i, True)
+
+
+_GEOMETRIES: Dict[str, Geometry] = {}
+
+
+def geometry(rules: Optional[Rules] = None) -> Geometry:
+    if rules is None:
+        return _DEFAULT
+    geo = _GEOMETRIES.get(rules.name)
+    if geo is None or geo.rules is not rules:
+        geo = _GEOMETRIES[rules.name] = Geometry(rules)
+    return geo
+
+
+_DEFAULT = geometry(DEFAULT_RULES)
+
+
+# ── Conversions ──────────────────────────────────────────────────────
+def pack(board: Board) -> bytes:
+    grid = board.grid
+    geo = geometry(board.rules)
+    out = bytearray(geo.n)
+    for i, (r, c) in enumerate(geo.squares):
+        p = grid[r][c]
+        if p is not None:
+            v = BLACK_MAN if p.color == BLACK else WHITE_MAN
+            out[i] = v + 1 if p.is_king else v
+    return bytes(out)
+
+
+def unpack(packed: bytes, rules: Optional[Rules] = None) -> Board:
+    geo = geometry(rules)
+    board = Board(setup=False, rules=geo.rules)
+    for i, v in enumerate(packed):
+        if v:
+            r, c = geo.squares[i]
+            p = Piece(r, c, WHITE if v & WHITE_BIT else BLACK)
+            p.is_king = bool(v & KING_BIT)
+            board.grid[r][c] = p
+    return board
+
+
+_FEN_COLORS = {"B": BLACK, "W": WHITE}
+_FEN_MEN = {"B": BLACK_MAN, "W": WHITE_MAN}
+
+
+def _pack_fen_fast(text: str, geo: Geometry) -> Optional[Tuple[bytes, str]]:
+    """Chemin rapide de pack_fen : None dès que la chaîne sort du cas simple
+    (intervalles, espaces, erreur)."""
+    fields = text.strip().rstrip(".").split(":")
+    turn = _FEN_COLORS.get(fields[0])
+    if turn is None:
+        return None
+    tokens = geo.fen_tokens
+    out = bytearray(geo.n)
+    for field in fields[1:]:
+        base = _FEN_MEN.get(field[:1])
+        if base is None:
+            return None
+        if len(field) == 1:
+            continue
+        for token in field[1:].split(","):
+            entry = tokens.get(token)
+            if entry is None:
+                return None
+            out[entry[0]] = base + 1 if entry[1] else base
+    return bytes(out), turn
+
+
+def pack_fen(text: str, rules: Optional[Rules] = None) -> Tuple[bytes, str]:
+    """FEN → (octets, camp au trait), sans passer par Board dans le cas simple."""
+    fast = _pack_fen_fast(text, geometry(rules))
+    if fast is not None:
+        return fast
+    board, turn = parse_fen(text, rules)   # intervalles, espaces, ou erreur détaillée
+    return pack(board), turn
+
+
+def path_to_positions(path: Sequence[int], rules: Optional[Rules] = None
+                      ) -> Tuple[Tuple[int, int], List[Tuple[int, int]]]:
+    """Chemin compact → (start_pos, seq) au format de MinimaxBot."""
+    squares = geometry(rules).squares
+    return squares[path[0]], [squares[i] for i in path[1:]]
+
+
+# ── Génération de coups ──────────────────────────────────────────────
+def _hops(pos, sq: int, v: int, geo: Geometry) -> List[Tuple[int, int]]:
+    """Prises immédiates depuis sq : [(case d'arrivée, case prise)]."""
+    own = v & WHITE_BIT
+    res = []
+    if v & KING_BIT and geo.flying:
+        for ray in geo.rays[sq]:
+            n = len(ray)
+            i = 0
+            while i < n and pos[ray[i]] == EMPTY:
+                i += 1
+            if i >= n - 1 or (pos[ray[i]] & WHITE_BIT) == own:
+                continue
+            cap = ray[i]
+            i += 1
+            while i < n and pos[ray[i]] == EMPTY:
+                res.append((ray[i], cap))
+                i += 1
+    else:
+        for ray in geo.capture_rays[v][sq]:
+            t = pos[ray[0]]
+            if t and (t & WHITE_BIT) != own and pos[ray[1]] == EMPTY:
+                res.append((ray[1], ray[0]))
+    return res
+
+
+def _chains(pos: bytearray, start: int, out: list, geo: Geometry) -> None:
+    """Rafles complètes depuis start (make/unmake sur pos), dédoublées par
+    (case finale, type de pièce, cases prises)."""
+    seen = set()
+    path = [start]
+    taken: List[int] = []
+    promotion = geo.promotion
+
+    def walk(sq: int) -> None:
+        v = pos[sq]
+        hops = _hops(pos, sq, v, geo)
+        if not hops:
+            if taken:
+                key = (sq, v, frozenset(taken))
+                if key not in seen:
+                    seen.add(key)
+                    out.append((tuple(path), bytes(pos)))
+            return
+        for land, cap in hops:
+            cv = pos[cap]
+            nv = v + 1 if (not v & KING_BIT and land in promotion[v]) else v
+            pos[sq] = EMPTY
+            pos[cap] = EMPTY
+            pos[land] = nv
+            path.append(land)
+            taken.append(cap)
+            walk(land)
+            taken.pop()
+            path.pop()
+            pos[land] = EMPTY
+            pos[cap] = cv
+            pos[sq] = v
+
+    walk(start)
+
+
+def _max_chains(pos: bytearray, own: int, out: list, geo: Geometry) -> None:
+    """
+    Prise majoritaire : rafles maximales de tout le camp own, par séparation
+    et évaluation (voir game/captures.py pour le majorant). Dédoublées comme
+    dans _chains, en tenant compte de la case de départ.
+    """
+    parity = geo.parity
+    flying = geo.flying
+    promotion = geo.promotion
+    promotion_parity = geo.promotion_parity
+    enemy = [0, 0]
+    for sq in range(geo.n):
+        v = pos[sq]
+        if v and (v & WHITE_BIT) != own and geo.interior[sq]:
+            enemy[parity[sq]] += 1
+
+    best = 1
+    seen = set()
+    path: List[int] = []
+    taken: List[int] = []
+
+    def walk(sq: int) -> None:
+        nonlocal best
+        v = pos[sq]
+        if flying and (v & KING_BIT or parity[sq] == promotion_parity[v]):
+            bound = enemy[0] + enemy[1]
+        else:
+            bound = enemy[1 - parity[sq]]
+        if len(taken) + bound < best:
+            return
+        hops = _hops(pos, sq, v, geo)
+        if not hops:
+            n = len(taken)
+            if n >= best:
+                if n > best:
+                    best = n
+                    out.clear()
+                    seen.clear()
+                key = (path[0], sq, v, frozenset(taken))
+                if key not in seen:
+                    seen.add(key)
+                    out.append((tuple(path), bytes(pos)))
+            return
+        for land, cap in hops:
+            cv = pos[cap]
+            nv = v + 1 if (not v & KING_BIT and land in promotion[v]) else v
+            pos[sq] = EMPTY
+            pos[cap] = EMPTY
+            pos[land] = nv
+            enemy[parity[cap]] -= 1
+            path.append(land)
+            taken.append(cap)
+            walk(land)
+            taken.pop()
+            path.pop()
+            enemy[parity[cap]] += 1
+            pos[land] = EMPTY
+            pos[cap] = cv
+            pos[sq] = v
+
+    for sq in range(geo.n):
+        v = pos[sq]
+        if v and (v & WHITE_BIT) == own:
+            path.append(sq)
+            walk(sq)
+            path.pop()
+
+
+def _has_capture(pos, own: int, geo: Geometry) -> bool:
+    for sq in range(geo.n):
+        v = pos[sq]
+        if v and (v & WHITE_BIT) == own and _hops(pos, sq, v, geo):
+            return True
+    return False
+
+
+def legal_moves(packed: bytes, turn: str,
+                rules: Optional[Rules] = None) -> List[Tuple[Path, bytes]]:
+    """Tours complets légaux : [(chemin, position résultante)], rafles en tête."""
+    geo = geometry(rules)
+    pos = bytearray(packed)
+    own = WHITE_BIT if turn == WHITE else 0
+    out: List[Tuple[Path, bytes]] = []
+
+    if geo.max_capture:
+        _max_chains(pos, own, out, geo)
+        if out:
+            return out
+    elif _has_capture(pos, own, geo):
+        for sq in range(geo.n):
+            v = pos[sq]
+            if v and (v & WHITE_BIT) == own:
+                _chains(pos, sq, out, geo)
+        out.sort(key=lambda m: len(m[0]), reverse=True)
+        return out
+
+    flying = geo.flying
+    for sq in range(geo.n):
+        v = pos[sq]
+        if not v or (v & WHITE_BIT) != own:
+            continue
+        if v & KING_BIT and flying:
+            for ray in geo.rays[sq]:
+                for to in ray:
+                    if pos[to] != EMPTY:
+                        break
+                    pos[sq] = EMPTY
+                    pos[to] = v
+                    out.append(((sq, to), bytes(pos)))
+                    pos[to] = EMPTY
+                    pos[sq] = v
+        else:
+            promotion = geo.promotion.get(v, ())
+            for to in geo.steps[v][sq]:
+                if pos[to] == EMPTY:
+                    pos[sq] = EMPTY
+                    pos[to] = v + 1 if to in promotion else v
+                    out.append(((sq, to), bytes(pos)))
+                    pos[to] = EMPTY
+                    pos[sq] = v
+    return out
+
+
+# ── Encodage et traitement par lots ──────────────────────────────────
+def encode_moves(moves: Iterable[Tuple[Path, bytes]]) -> bytes:
+    """[(chemin, _)] → octets : longueur du chemin puis ses cases, coup après coup."""
+    buf = bytearray()
+    for path, _ in moves:
+        buf.append(len(path))
+        buf.extend(path)
+    return bytes(buf)
+
+
+def decode_moves(buf: bytes) -> List[Path]:
+    moves = []
+    i = 0
+    while i < len(buf):
+        n = buf[i]
+        moves.append(tuple(buf[i + 1:i + 1 + n]))
+        i += 1 + n
+    return moves
+
+
+def _normalize(position: Position, rules: Optional[Rules]) -> Tuple[bytes, str]:
+    if isinstance(position, str):
+        return pack_fen(position, rules)
+    return position
+
+
+def _one(position: Position, rules: Optional[Rules] = None):
+    packed, turn = _normalize(position, rules)
+    return encode_moves(legal_moves(packed, turn, rules))
+
+
+def _one_with_positions(position: Position, rules: Optional[Rules] = None):
+    packed, turn = _normalize(position, rules)
+    moves = legal_moves(packed, turn, rules)
+    return encode_moves(moves), [after for _, after in moves]
+
+
+def batch_legal_moves(positions: Iterable[Position], workers: int = 0,
+                      chunksize: int = 1024, with_positions: bool = False,
+                      rules: Optional[Rules] = None) -> list:
+    """
+    Coups légaux encodés (voir encode_moves) pour chaque position, dans
+    l'ordre. Une position est une FEN ou un couple (octets, camp au trait).
+    with_positions=True : éléments (coups encodés, [positions résultantes]).
+    workers > 0 : répartition sur un pool de processus, par paquets de chunksize.
+    """
+    fn = _one_with_positions if with_positions else _one
+    if rules is not None:
+        fn = partial(fn, rules=rules)
+    if workers <= 0:
+        return [fn(p) for p in positions]
+    with Pool(workers) as pool:
+        return pool.map(fn, positions, chunksize=chunksize)
@@ -1,13 +1,38 @@
 from typing import Optional, Dict, Tuple, List
 
 from game.board import Board
-from game.piece import WHITE, BLACK, Piece
+from game.piece import WHITE, BLACK, DRAW, Piece
+from game.rules import Rules
+from game.captures import max_capture_chains
+from game.notation import parse_fen, to_fen
+from game.zobrist import position_hash
+
+REPETITION_DRAW  = 3    # même position (même camp au trait) 3 fois : nulle
+DRAW_QUIET_PLIES = 50   # 25 coups par camp sans prise ni mouvement de pion : nulle
+
+
+def max_game_plies(rules: Rules) -> int:
+    """
+    Borne sur la longueur d'une partie dans la variante rules. Les coups
+    irréversibles sont en nombre fini : chaque pièce est prise au plus une
+    fois, un pion avance d'une rangée par coup simple et recule d'au plus
+    deux rangées par prise. Entre deux d'entre eux, la nulle tombe après
+    DRAW_QUIET_PLIES demi-coups.
+    """
+    men = rules.rows_of_men * rules.size          # pions des deux camps
+    irreversible = men * (rules.size - 1) + 2 * men + men
+    return irreversible + (irreversible + 1) * DRAW_QUIET_PLIES
 
 
 class Game:
-    def __init__(self):
-        self.board = Board()
-        self.turn = BLACK
+    def __init__(self, board: Optional[Board] = None, turn: Optional[str] = None,
+                 rules: Optional[Rules] = None):
+        """rules : variante (game/rules.py) ; par défaut celle du plateau
+        fourni, sinon la variante classique. turn : par défaut le camp qui
+        commence dans la variante."""
+        self.board = board if board is not None else Board(rules=rules)
+        self.rules = self.board.rules
+        self.turn = turn if turn is not None else self.rules.first_turn
 
         self.selected: Optional[Piece] = None
         self.valid_moves: Dict[Tuple[int, int], List[Piece]] = {}
@@ -19,6 +44,33 @@ class Game:
         # True seulement quand une chaîne de captures est en cours (après une capture)
         self.in_chain: bool = False
 
+        # Prise majoritaire (rules.max_capture) : rafles maximales du tour,
+        # calculées au premier besoin, et rafle en cours (départ, arrivées)
+        self._max_chains: Optional[List[Tuple[Tuple[int, int], List[Tuple[int, int]]]]] = None
+        self._chain_start: Optional[Tuple[int, int]] = None
+        self._chain_path: List[Tuple[int, int]] = []
+
+        # Historique des positions (hachages Zobrist, fin de tour) depuis le
+        # dernier coup irréversible (prise ou mouvement de pion) : une position
+        # antérieure ne peut plus revenir, on repart de zéro.
+        # repetitions compte les occurrences : test de répétition en O(1).
+        self.history: List[int] = []
+        self.repetitions: Dict[int, int] = {}
+        self.quiet_plies = 0
+        self._irreversible = False
+        self._record_position()
+
+    # -------------------------
+    # Positions en notation FEN (voir game/notation.py)
+    # -------------------------
+    @classmethod
+    def from_fen(cls, text: str, rules: Optional[Rules] = None) -> "Game":
+        board, turn = parse_fen(text, rules)
+        return cls(board, turn)
+
+    def to_fen(self) -> str:
+        return to_fen(self.board, self.turn)
+
     # -------------------------
     # Capture obligatoire + enchaînement
     # -------------------------
@@ -26,9 +78,8 @@ class Game:
         return {pos: caps for pos, caps in moves.items() if caps}
 
     def _has_any_capture(self, color: str) -> bool:
-        for r in range(8):
-            for c in range(8):
-                p = self.board.get_piece(r, c)
+        for row in self.board.grid:
+            for p in row:
                 if p is None or p.color != color:
                     continue
                 moves = self.board.get_valid_moves(p)
@@ -39,23 +90,39 @@ class Game:
     def _piece_capture_moves(self, piece: Piece) -> Dict[Tuple[int, int], List[Piece]]:
         return self._capture_moves_only(self.board.get_valid_moves(piece))
 
+    # -------------------------
+    # Prise majoritaire (variantes avec rules.max_capture)
+    # -------------------------
+    def _maximal_chains(self) -> List[Tuple[Tuple[int, int], List[Tuple[int, int]]]]:
+        """Rafles maximales du camp au trait (voir game/captures.py)."""
+        if self._max_chains is None:
+            _, chains = max_capture_chains(self.board, self.turn)
+            self._max_chains = [(start, seq) for start, seq, _ in chains]
+        return self._max_chains
+
+    def _max_chain_steps(self, start: Tuple[int, int], path: List[Tuple[int, int]],
+                         moves: Dict[Tuple[int, int], List[Piece]]) -> Dict[Tuple[int, int], List[Piece]]:
+        """Ne garde que les prises qui prolongent (start, path) vers une rafle maximale."""
+        done = len(path)
+        allowed = {seq[done] for s, seq in self._maximal_chains()
+                   if s == start and len(seq) > done and seq[:done] == path}
+        return {pos: caps for pos, caps in moves.items() if pos in allowed}
+
     # -------------------------
     # Winner detection
     # -------------------------
     def _pieces_count(self, color: str) -> int:
         count = 0
-        for r in range(8):
-            for c in range(8):
-                p = self.board.get_piece(r, c)
+        for row in self.board.grid:
+            for p in row:
                 if p is not None and p.color == color:
                     count += 1
         return count
 
     def _has_any_move(self, color: str) -> bool:
         must_capture = self._has_any_capture(color)
-        for r in range(8):
-            for c in range(8):
-                p = self.board.get_piece(r, c)
+        for row in self.board.grid:
+            for p in row:
                 if p is None or p.color != color:
                     continue
                 moves = self.board.get_valid_moves(p)
@@ -76,7 +143,16 @@ class Game:
         if not self._has_any_move(WHITE):
             return BLACK
 
+        if self.is_draw():
+            return DRAW
         return None
+
+    def is_draw(self) -> bool:
+        """Triple répétition ou DRAW_QUIET_PLIES demi-coups sans progrès."""
+        if self.quiet_plies >= DRAW_QUIET_PLIES:
+            return True
+        return self.repetitions[self.history[-1]] >= REPETITION_DRAW
+
     def legal_moves_for(self, color: str):
         """
         Retourne une liste de coups sous forme:
@@ -85,15 +161,16 @@ class Game:
         all_moves = []
         must_capture = self._has_any_capture(color)
 
-        for r in range(8):
-            for c in range(8):
-                p = self.board.get_piece(r, c)
+        for row in self.board.grid:
+            for p in row:
                 if p is None or p.color != color:
                     continue
 
                 moves = self.board.get_valid_moves(p)
                 if must_capture:
                     moves = self._capture_moves_only(moves)
+                    if self.rules.max_capture and color == self.turn:
+                        moves = self._max_chain_steps((p.row, p.col), [], moves)
 
                 for (tr, tc), captured in moves.items():
                     all_moves.append((p, (tr, tc), captured))
@@ -128,11 +205,16 @@ class Game:
         # Capture obligatoire au niveau du joueur
         if self._has_any_capture(self.turn):
             moves = self._capture_moves_only(moves)
+            # Prise majoritaire : premiers pas des rafles maximales seulement
+            if self.rules.max_capture:
+                moves = self._max_chain_steps((row, col), [], moves)
             if not moves:
                 return False
 
         self.selected = piece
         self.valid_moves = moves
+        self._chain_start = (row, col)
+        self._chain_path = []
         return True
 
     def move_selected(self, row: int, col: int) -> bool:
@@ -153,6 +235,9 @@ class Game:
         self.last_captured_squares = []
         self.capture_flash_frames = 0
 
+        if captured or not self.selected.is_king:
+            self._irreversible = True
+
         # jouer le coup
         self.board.move(self.selected, row, col)
 
@@ -164,6 +249,9 @@ class Game:
 
             # ENCHAÎNEMENT: seulement maintenant (après capture)
             chain = self._piece_capture_moves(self.selected)
+            if self.rules.max_capture:
+                self._chain_path.append(key)
+                chain = self._max_chain_steps(self._chain_start, self._chain_path, chain)
             if chain:
                 self.in_chain = True
                 self.valid_moves = chain
@@ -177,4 +265,19 @@ class Game:
         self.selected = None
         self.valid_moves = {}
         self.in_chain = False
-        self.turn = WHITE if self.turn == BLACK else BLACK
\ No newline at end of file
+        self._max_chains = None
+        self._chain_path = []
+        self.turn = WHITE if self.turn == BLACK else BLACK
+        self._record_position()
+
+    def _record_position(self) -> None:
+        h = position_hash(self.board, self.turn)
+        if self._irreversible:
+            self.history = []
+            self.repetitions = {}
+            self.quiet_plies = 0
+            self._irreversible = False
+        elif self.history:
+            self.quiet_plies += 1
+        self.history.append(h)
+        self.repetitions[h] = self.repetitions.get(h, 0) + 1
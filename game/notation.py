@@ -0,0 +1,154 @@
+"""
+Notation texte des positions (FEN des dames, format PDN) :
+
+    B:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12
+
+- premier champ : camp au trait (B = noirs, W = blancs) ;
+- puis un champ par couleur : numéros des cases occupées, K devant une dame
+  (ex. "K7"), intervalles "1-12" acceptés en lecture.
+
+Les cases foncées sont numérotées de 1 à 32 ligne par ligne depuis le haut
+(côté noir) : la case 1 est (0, 1), la case 32 est (7, 6). Sur les autres
+plateaux (variantes de game/rules.py) la numérotation suit le même principe,
+de 1 à 50 en 10x10.
+Les coups s'écrivent "9-13" (simple) ou "9x18x27" (prises).
+
+Lecture et écriture passent par des tables précalculées (numéro ↔ case,
+jeton texte ↔ case) pour charger des corpus de millions de positions :
+voir iter_fen_file().
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from game.board import Board, COLS
+from game.piece import Piece, WHITE, BLACK
+from game.rules import Rules
+
+Pos = Tuple[int, int]
+
+_COLOR_CODE = {BLACK: "B", WHITE: "W"}
+_CODE_COLOR = {"B": BLACK, "W": WHITE}
+
+
+def square_number(row: int, col: int, size: int = COLS) -> int:
+    """Numéro (1-32 en 8x8) de la case foncée (row, col)."""
+    return row * (size // 2) + col // 2 + 1
+
+
+def square_pos(num: int, size: int = COLS) -> Pos:
+    """Case (row, col) du numéro 1-32 (8x8)."""
+    row, k = divmod(num - 1, size // 2)
+    return row, 2 * k + (1 if row % 2 == 0 else 0)
+
+
+class _Tables:
+    """Tables précalculées d'une taille de plateau."""
+
+    def __init__(self, size: int):
+        self.n_squares = size * size // 2
+        self.squares: List[Pos] = [square_pos(n, size)
+                                   for n in range(1, self.n_squares + 1)]
+        # "7" → ((r, c), False), "K7" → ((r, c), True)
+        self.tokens = {}
+        for n, pos in enumerate(self.squares, start=1):
+            self.tokens[str(n)] = (pos, False)
+            self.tokens["K" + str(n)] = (pos, True)
+        # (r, c) → (jeton pion, jeton dame)
+        self.pos_tokens = {pos: (str(n), "K" + str(n))
+                           for n, pos in enumerate(self.squares, start=1)}
+
+
+_TABLES: Dict[int, _Tables] = {}
+
+
+def _tables(size: int) -> _Tables:
+    tables = _TABLES.get(size)
+    if tables is None:
+        tables = _TABLES[size] = _Tables(size)
+    return tables
+
+
+def _expand_range(token: str, text: str, tables: _Tables) -> List[Tuple[Pos, bool]]:
+    king = token[:1] == "K"
+    if king:
+        token = token[1:]
+    try:
+        lo, hi = (int(x) for x in token.split("-"))
+    except ValueError:
+        raise ValueError(f"FEN invalide (case {token!r}) : {text!r}")
+    if not (1 <= lo <= hi <= tables.n_squares):
+        raise ValueError(f"FEN invalide (intervalle {token!r}) : {text!r}")
+    return [(tables.squares[n - 1], king) for n in range(lo, hi + 1)]
+
+
+def parse_fen(text: str, rules: Optional[Rules] = None) -> Tuple[Board, str]:
+    """Construit (plateau, camp au trait) depuis une chaîne FEN
+    (variante classique par défaut)."""
+    fields = text.strip().rstrip(".").split(":")
+    turn = _CODE_COLOR.get(fields[0])
+    if turn is None:
+        raise ValueError(f"FEN invalide (camp au trait) : {text!r}")
+
+    board = Board(setup=False, rules=rules)
+    grid = board.grid
+    tables = _tables(board.rules.size)
+    tokens = tables.tokens
+    for field in fields[1:]:
+        color = _CODE_COLOR.get(field[:1])
+        if color is None:
+            raise ValueError(f"FEN invalide (champ {field!r}) : {text!r}")
+        body = field[1:]
+        if not body:
+            continue
+        for token in body.split(","):
+            entry = tokens.get(token)
+            if entry is not None:
+                entries = (entry,)
+            else:
+                token = token.strip()
+                if not token:
+                    continue    # virgule en trop : "W21,,22", "W21, ,22"
+                entry = tokens.get(token)
+                entries = (entry,) if entry is not None else _expand_range(token, text, tables)
+            for (r, c), king in entries:
+                p = Piece(r, c, color)
+                if king:
+                    p.is_king = True
+                grid[r][c] = p
+    return board, turn
+
+
+def to_fen(board: Board, turn: str) -> str:
+    """Chaîne FEN de la position (cases triées, sans intervalles)."""
+    white, black = [], []
+    grid = board.grid
+    tables = _tables(board.rules.size)
+    pos_tokens = tables.pos_tokens
+    for pos in tables.squares:
+        p = grid[pos[0]][pos[1]]
+        if p is None:
+            continue
+        token = pos_tokens[pos][p.is_king]
+        (black if p.color == BLACK else white).append(token)
+    return f"{_COLOR_CODE[turn]}:W{','.join(white)}:B{','.join(black)}"
+
+
+def iter_fens(lines: Iterable[str],
+              rules: Optional[Rules] = None) -> Iterator[Tuple[Board, str]]:
+    """(plateau, camp au trait) pour chaque ligne non vide (# = commentaire)."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield parse_fen(line, rules)
+
+
+def iter_fen_file(path: str,
+                  rules: Optional[Rules] = None) -> Iterator[Tuple[Board, str]]:
+    """Lit un corpus de positions, une FEN par ligne, sans tout charger en mémoire."""
+    with open(path, encoding="utf-8") as f:
+        yield from iter_fens(f, rules)
+
+
+def move_to_text(start: Pos, seq: List[Pos], capture: bool, size: int = COLS) -> str:
+    """Coup en notation numérique : "9-13" ou "9x18x27"."""
+    sep = "x" if capture else "-"
+    return sep.join(str(square_number(*p, size)) for p in [start] + list(seq))
@@ -1,9 +1,8 @@
 # game/piece.py
 
-ROWS, COLS = 8, 8
-
 WHITE = "WHITE"
 BLACK = "BLACK"
+DRAW = "DRAW"     # résultat de partie nulle (Game.winner)
 
 
 class Piece:
@@ -0,0 +1,105 @@
+"""
+Variantes de règles et géométrie du plateau.
+
+Un objet Rules décrit une variante (taille du plateau, nombre de rangées de
+pions, prise arrière des pions, dames volantes ou non, camp qui commence,
+prise majoritaire obligatoire)
+et précalcule les tables de géométrie utilisées par la génération de coups
+(Board.get_valid_moves, game/compact.py) : plus aucun test de bord dans
+les boucles chaudes.
+
+    from game.rules import get_rules
+    Game(rules=get_rules("internationale"))
+
+Variantes fournies (VARIANTS) :
+    "classique"      8x8, pions qui prennent en arrière, dames volantes (défaut)
+    "internationale" 10x10, 4 rangées de pions, prises arrière, dames volantes,
+                     les blancs commencent, prise majoritaire (la rafle qui
+                     prend le plus de pièces est obligatoire, voir
+                     game/captures.py)
+    "anglaise"       8x8, pions qui ne prennent qu'en avant, dames courtes
+"""
+from typing import Dict, List, Tuple
+
+from game.piece import WHITE, BLACK
+
+Pos = Tuple[int, int]
+
+# Indices de direction : 0, 1 vers le haut (sens des blancs), 2, 3 vers le bas
+DIRECTIONS: Tuple[Pos, ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL_DIRS = (0, 1, 2, 3)
+
+
+class Rules:
+    def __init__(self, name: str, size: int = 8, rows_of_men: int = 3,
+                 men_capture_backward: bool = True, flying_kings: bool = True,
+                 first_turn: str = BLACK, max_capture: bool = False):
+        if size % 2 or not 0 < rows_of_men < size // 2:
+            raise ValueError(f"géométrie invalide : {size}x{size}, {rows_of_men} rangées")
+        self.name = name
+        self.size = size
+        self.rows_of_men = rows_of_men
+        self.men_capture_backward = men_capture_backward
+        self.flying_kings = flying_kings
+        self.first_turn = first_turn
+        self.max_capture = max_capture
+
+        # Cases foncées, dans l'ordre de la notation (case n → indice n - 1)
+        self.dark_squares: List[Pos] = [(r, c) for r in range(size)
+                                        for c in range(size) if (r + c) % 2 == 1]
+        self.n_squares = len(self.dark_squares)
+        # Cases intérieures : seules cases où une pièce peut être prise
+        # (il faut une case d'arrivée derrière elle)
+        self.interior = frozenset((r, c) for r, c in self.dark_squares
+                                  if 0 < r < size - 1 and 0 < c < size - 1)
+
+        # rays[r][c][d] : cases successives depuis (r, c) dans la direction d,
+        # jusqu'au bord (vide hors des cases foncées, jamais consulté)
+        self.rays: List[List[Tuple[Tuple[Pos, ...], ...]]] = [
+            [tuple(self._ray(r, c, dr, dc) for dr, dc in DIRECTIONS)
+             if (r + c) % 2 == 1 else ()
+             for c in range(size)]
+            for r in range(size)]
+
+        # Directions des pions : déplacement simple et prise
+        self.man_dirs = {WHITE: (0, 1), BLACK: (2, 3)}
+        self.man_capture_dirs = (
+            {WHITE: ALL_DIRS, BLACK: ALL_DIRS} if men_capture_backward
+            else self.man_dirs)
+        self.promotion_row = {WHITE: 0, BLACK: size - 1}
+
+    def _ray(self, r: int, c: int, dr: int, dc: int) -> Tuple[Pos, ...]:
+        ray = []
+        r, c = r + dr, c + dc
+        while 0 <= r < self.size and 0 <= c < self.size:
+            ray.append((r, c))
+            r, c = r + dr, c + dc
+        return tuple(ray)
+
+    def __repr__(self) -> str:
+        return f"Rules({self.name!r})"
+
+    def __reduce__(self):
+        # Variantes connues : transmises par leur nom aux processus fils
+        # (et conservées telles quelles par copy.deepcopy)
+        if VARIANTS.get(self.name) is self:
+            return get_rules, (self.name,)
+        return Rules, (self.name, self.size, self.rows_of_men,
+                       self.men_capture_backward, self.flying_kings, self.first_turn,
+                       self.max_capture)
+
+
+CLASSIC = Rules("classique")
+INTERNATIONAL = Rules("internationale", size=10, rows_of_men=4, first_turn=WHITE,
+                      max_capture=True)
+ENGLISH = Rules("anglaise", men_capture_backward=False, flying_kings=False)
+
+VARIANTS: Dict[str, Rules] = {r.name: r for r in (CLASSIC, INTERNATIONAL, ENGLISH)}
+DEFAULT_RULES = CLASSIC
+
+
+def get_rules(name: str) -> Rules:
+    try:
+        return VARIANTS[name]
+    except KeyError:
+        raise ValueError(f"variante inconnue : {name!r} (choix : {', '.join(VARIANTS)})")
@@ -0,0 +1,45 @@
+"""
+Hachage Zobrist des positions : une clé aléatoire de 64 bits par
+(case, type de pièce), plus une clé pour le camp au trait. Le hachage d'une
+position est le XOR des clés de ses pièces ; deux positions identiques avec
+le même camp au trait ont toujours le même hachage.
+
+Les clés sont tirées avec une graine fixe : les hachages sont stables d'une
+exécution à l'autre (et entre processus).
+"""
+import random
+from typing import Dict, List
+
+from game.board import Board
+from game.piece import WHITE
+
+_SEED = 0x5EED_DA3E
+
+TURN_KEY = random.Random(_SEED).getrandbits(64)   # présent quand les blancs ont le trait
+
+# Par taille de plateau : keys[r][c][k] avec k = 0 pion noir, 1 dame noire,
+# 2 pion blanc, 3 dame blanche
+_PIECE_KEYS: Dict[int, List[List[List[int]]]] = {}
+
+
+def piece_keys(size: int) -> List[List[List[int]]]:
+    """Clés des pièces d'un plateau size x size, tirées à la première
+    demande avec une graine propre à la taille (toute géométrie de Rules)."""
+    keys = _PIECE_KEYS.get(size)
+    if keys is None:
+        rng = random.Random(_SEED + size)
+        keys = _PIECE_KEYS[size] = [
+            [[rng.getrandbits(64) for _ in range(4)] for _ in range(size)]
+            for _ in range(size)]
+    return keys
+
+
+def position_hash(board: Board, turn: str) -> int:
+    h = TURN_KEY if turn == WHITE else 0
+    table = piece_keys(board.rules.size)
+    for r, row in enumerate(board.grid):
+        keys = table[r]
+        for c, p in enumerate(row):
+            if p is not None:
+                h ^= keys[c][(2 if p.color == WHITE else 0) + p.is_king]
+    return h
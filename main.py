@@ -1,36 +1,33 @@
-import pygame
 import threading
 
 from game.game import Game
 from game.piece import WHITE, BLACK
-from ui.renderer import (Renderer, WIDTH, HEIGHT, SQUARE_SIZE,
-                          HUD_HEIGHT, BORDER, cell_center_px)
+from ui.layout import WIDTH, HEIGHT, cell_center_px, square_at
 from ai.minimax_bot import MinimaxBot, clone_board
 
 FPS           = 60
 MOVE_ANIM_MS  = 220
 STEP_PAUSE_MS = 120
+BOT_PAUSE_MS  = 280
+IDLE_WAIT_MS  = 1000                    # réveil max. quand rien ne bouge
 
 
-def get_row_col_from_mouse(pos):
-    x, y = pos
-    if y < HUD_HEIGHT + BORDER:
-        return None
-    col = (x - BORDER) // SQUARE_SIZE
-    row = (y - HUD_HEIGHT - BORDER) // SQUARE_SIZE
-    if 0 <= row < 8 and 0 <= col < 8:
-        return row, col
-    return None
+def main():
+    # pygame (et le rendu) ne sont chargés qu'au lancement de la fenêtre :
+    # importer ce module, game ou ai reste léger
+    import pygame
+    from ui.renderer import Renderer
 
+    BOT_DONE = pygame.USEREVENT + 1     # posté par le thread du bot
 
-def main():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Jeu de dames")
 
     clock    = pygame.time.Clock()
-    renderer = Renderer(screen)
+    renderer = Renderer(screen, dirty=True)
     game     = Game()
+    winner   = game.winner()
 
     human_color = BLACK
     bot         = MinimaxBot(WHITE, depth=5)
@@ -40,29 +37,54 @@ def main():
     bot_seq_index     = 0
     bot_step_ready_at = 0
     bot_thread        = None
-    bot_result        = [None]
+    bot_token         = 0     # invalide les résultats d'une partie remise à zéro
 
     # Animation state
     anim      = None
     prev_turn = game.turn
 
     def reset_game():
-        nonlocal game, bot_plan, bot_seq_index, bot_step_ready_at
-        nonlocal bot_thread, anim, prev_turn
+        nonlocal game, winner, bot_plan, bot_seq_index, bot_step_ready_at
+        nonlocal bot_thread, bot_token, anim, prev_turn
         game              = Game()
+        winner            = game.winner()
         bot_plan          = None
         bot_seq_index     = 0
         bot_step_ready_at = 0
         bot_thread        = None
-        bot_result[0]     = None
+        bot_token        += 1
         anim              = None
         prev_turn         = game.turn
 
+    def start_anim(fr, to, piece, now):
+        return {
+            "from":  fr,
+            "to":    to,
+            "start": now,
+            "dur":   MOVE_ANIM_MS,
+            "meta":  {"color": piece.color, "is_king": piece.is_king},
+        }
+
     running = True
     while running:
-        clock.tick(FPS)
-        now    = pygame.time.get_ticks()
-        winner = game.winner()
+        # ── Attente ──────────────────────────────────────────────────
+        # Plein régime seulement pendant une animation, un flash ou la
+        # réflexion du bot ; sinon on dort jusqu'au prochain événement
+        # (ou jusqu'au prochain pas programmé du bot).
+        active = (anim is not None or game.capture_flash_frames > 0
+                  or bot_thread is not None)
+        if active:
+            clock.tick(FPS)
+            events = pygame.event.get()
+        else:
+            timeout = IDLE_WAIT_MS
+            if bot_plan is not None and bot_seq_index < len(bot_plan[1]):
+                timeout = max(1, min(timeout,
+                                     bot_step_ready_at - pygame.time.get_ticks()))
+            events = [pygame.event.wait(timeout)] + pygame.event.get()
+            clock.tick()
+
+        now = pygame.time.get_ticks()
 
         if game.capture_flash_frames > 0:
             game.capture_flash_frames -= 1
@@ -73,6 +95,7 @@ def main():
             t = (now - anim["start"]) / float(anim["dur"])
             if t >= 1.0:
                 game.move_selected(*anim["to"])
+                winner = game.winner()
                 anim = None
                 bot_step_ready_at = now + STEP_PAUSE_MS
             else:
@@ -89,17 +112,26 @@ def main():
             bot_plan          = None
             bot_seq_index     = 0
             bot_thread        = None
-            bot_result[0]     = None
             bot_step_ready_at = now
             prev_turn         = game.turn
 
         # ── Events ───────────────────────────────────────────────────
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                renderer.invalidate()
+
+            if event.type == BOT_DONE:
+                if event.token == bot_token and bot_thread is not None:
+                    bot_plan          = event.result
+                    bot_thread        = None
+                    bot_seq_index     = 0
+                    bot_step_ready_at = now + BOT_PAUSE_MS
+
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mp = pygame.mouse.get_pos()
+                mp = event.pos
 
                 if renderer.get_reset_rect().collidepoint(mp):
                     reset_game()
@@ -110,7 +142,7 @@ def main():
                 if game.turn != human_color:
                     continue
 
-                rc = get_row_col_from_mouse(mp)
+                rc = square_at(mp)
                 if rc is None:
                     continue
                 row, col = rc
@@ -127,40 +159,25 @@ def main():
                         fr    = (game.selected.row, game.selected.col)
                         piece = game.board.get_piece(*fr)
                         if piece is not None:
-                            anim = {
-                                "from":  fr,
-                                "to":    (row, col),
-                                "start": now,
-                                "dur":   MOVE_ANIM_MS,
-                                "meta":  {"color": piece.color,
-                                          "is_king": piece.is_king},
-                            }
+                            anim = start_anim(fr, (row, col), piece, now)
                     else:
                         game.select(row, col)
 
         # ── Bot (threaded) ───────────────────────────────────────────
-        bot_thinking = False
         if winner is None and game.turn == bot.color and anim is None:
 
-            if bot_plan is None:
-                if bot_thread is None:
-                    board_snap = clone_board(game.board)
-                    turn_snap  = game.turn
-                    bot_result[0] = None
-
-                    def _think(b=board_snap, t=turn_snap):
-                        bot_result[0] = bot.choose_move_sequence(b, t)
+            if bot_plan is None and bot_thread is None:
+                board_snap = clone_board(game.board)
+                turn_snap  = game.turn
+                hist_snap  = (list(game.history), game.quiet_plies)
 
-                    bot_thread = threading.Thread(target=_think, daemon=True)
-                    bot_thread.start()
+                def _think(b=board_snap, t=turn_snap, h=hist_snap, token=bot_token):
+                    result = bot.choose_move_sequence(b, t, *h)
+                    pygame.event.post(pygame.event.Event(
+                        BOT_DONE, {"result": result, "token": token}))
 
-                if bot_thread is not None and bot_thread.is_alive():
-                    bot_thinking = True
-                else:
-                    bot_plan          = bot_result[0]
-                    bot_thread        = None
-                    bot_seq_index     = 0
-                    bot_step_ready_at = now + 280
+                bot_thread = threading.Thread(target=_think, daemon=True)
+                bot_thread.start()
 
             if bot_plan is not None:
                 start_pos, seq = bot_plan
@@ -178,19 +195,14 @@ def main():
                         bot_plan   = None
                         bot_thread = None
                     else:
-                        anim = {
-                            "from":  fr,
-                            "to":    to,
-                            "start": now,
-                            "dur":   MOVE_ANIM_MS,
-                            "meta":  {"color": piece.color,
-                                      "is_king": piece.is_king},
-                        }
+                        anim = start_anim(fr, to, piece, now)
                         bot_seq_index += 1
 
         # ── Draw ─────────────────────────────────────────────────────
-        renderer.draw(game, winner, thinking=bot_thinking, moving=moving_draw)
-        pygame.display.flip()
+        dirty_rects = renderer.draw(game, winner, thinking=bot_thread is not None,
+                                    moving=moving_draw)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
     pygame.quit()
 
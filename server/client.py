@@ -0,0 +1,137 @@
+"""
+Client minimal pour server.game_server (tests de charge).
+
+    python -m server.client --games 200 --connections 8
+
+Chaque partie joue des coups humains aléatoires jusqu'à la fin ; les
+parties d'une même connexion sont multiplexées grâce au champ "id".
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from typing import Dict, Optional
+
+from game.board import Board
+from game.piece import Piece, WHITE, BLACK
+from game.rules import Rules, get_rules
+from ai.minimax_bot import generate_all_turn_moves
+
+MAX_PLIES = 200   # garde-fou (le serveur déclare aussi les nulles)
+
+
+def board_from_rows(rows, rules: Optional[Rules] = None) -> Board:
+    board = Board(setup=False, rules=rules)
+    for r, line in enumerate(rows):
+        for c, ch in enumerate(line):
+            if ch == ".":
+                continue
+            p = Piece(r, c, BLACK if ch.lower() == "b" else WHITE)
+            if ch.isupper():
+                p.make_king()
+            board.grid[r][c] = p
+    return board
+
+
+class StubClient:
+    def __init__(self):
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.ids = itertools.count(1)
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def connect(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+    async def _read_loop(self) -> None:
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            resp = json.loads(line)
+            fut = self.pending.pop(resp.get("id"), None)
+            if fut is not None and not fut.done():
+                fut.set_result(resp)
+
+    async def request(self, **req) -> dict:
+        req["id"] = next(self.ids)
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[req["id"]] = fut
+        self.writer.write(json.dumps(req).encode() + b"\n")
+        await self.writer.drain()
+        return await fut
+
+
+async def play_random_game(client: StubClient, rng: random.Random,
+                           depth: int = 2, time_budget: float = 10.0,
+                           variant: str = "classique") -> dict:
+    color = rng.choice([WHITE, BLACK])
+    state = await client.request(op="new", color=color, depth=depth,
+                                 time_budget=time_budget, variant=variant)
+    game_id = state["game_id"]
+
+    for _ in range(MAX_PLIES):
+        if not state["ok"] or state["winner"] is not None:
+            break
+        board = board_from_rows(state["board"], get_rules(state["variant"]))
+        moves = generate_all_turn_moves(board, state["turn"])
+        _, start, seq = rng.choice(moves)
+        state = await client.request(op="move", game_id=game_id,
+                                     start=list(start), path=[list(p) for p in seq])
+
+    return await client.request(op="close", game_id=game_id)
+
+
+async def run_load(host: str, port: int, games: int, connections: int,
+                   depth: int, time_budget: float, seed: int = 0,
+                   variant: str = "classique") -> dict:
+    clients = []
+    for _ in range(connections):
+        c = StubClient()
+        await c.connect(host, port)
+        clients.append(c)
+
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(
+        play_random_game(clients[i % connections], random.Random(rng.random()),
+                         depth, time_budget, variant)
+        for i in range(games)))
+    elapsed = time.perf_counter() - t0
+
+    for c in clients:
+        await c.close()
+
+    lat = [r["latency_avg"] for r in results if r.get("latency_avg") is not None]
+    return {
+        "games": games,
+        "elapsed": round(elapsed, 2),
+        "bot_moves": sum(r.get("bot_moves", 0) for r in results),
+        "latency_avg": round(sum(lat) / len(lat), 4) if lat else None,
+        "latency_max": max((r["latency_max"] for r in results
+                            if r.get("latency_max") is not None), default=None),
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Client de charge pour le serveur de dames")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--games", type=int, default=100)
+    ap.add_argument("--connections", type=int, default=4)
+    ap.add_argument("--depth", type=int, default=2)
+    ap.add_argument("--time-budget", type=float, default=10.0)
+    ap.add_argument("--variant", default="classique")
+    args = ap.parse_args()
+    print(asyncio.run(run_load(args.host, args.port, args.games, args.connections,
+                               args.depth, args.time_budget, variant=args.variant)))
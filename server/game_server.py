@@ -0,0 +1,362 @@
+"""
+Serveur asyncio : beaucoup de parties humain contre bot en parallèle.
+
+Protocole : une requête JSON par ligne sur TCP, une réponse JSON par ligne.
+Le champ optionnel "id" d'une requête est renvoyé tel quel dans sa réponse,
+ce qui permet de mener plusieurs parties sur une même connexion.
+
+    {"op": "new", "color": "BLACK", "depth": 6, "time_budget": 60,
+     "variant": "classique"}          (variantes : game/rules.py)
+    {"op": "move", "game_id": 1, "start": [5, 0], "path": [[4, 1]]}
+    {"op": "state", "game_id": 1}
+    {"op": "metrics"}                 (ou avec "game_id")
+    {"op": "close", "game_id": 1}
+
+Les recherches du bot partent dans un pool de processus partagé. Une file
+FIFO unique (au plus un coup en attente par partie, les tours alternent)
+et un répartiteur par processus assurent un ordonnancement équitable.
+Chaque partie a un budget de temps de réflexion total, réparti sur ses coups.
+
+    python -m server.game_server --port 8765 --workers 4
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from game.game import Game
+from game.piece import WHITE, BLACK
+from game.rules import get_rules
+from ai.minimax_bot import MinimaxBot, opponent
+
+DEFAULT_DEPTH       = 6
+DEFAULT_TIME_BUDGET = 120.0    # secondes de réflexion du bot par partie
+MAX_MOVE_TIME       = 2.0      # plafond par coup
+MIN_MOVE_TIME       = 0.05
+MOVES_HORIZON       = 20       # le budget restant est réparti sur ~20 coups
+
+
+def board_rows(board) -> List[str]:
+    """Plateau en une chaîne par rangée : '.' vide, 'b'/'w' pions, 'B'/'W' dames."""
+    rows = []
+    for row in board.grid:
+        line = []
+        for p in row:
+            if p is None:
+                line.append(".")
+            else:
+                ch = "b" if p.color == BLACK else "w"
+                line.append(ch.upper() if p.is_king else ch)
+        rows.append("".join(line))
+    return rows
+
+
+def search_move(board, turn: str, depth: int, time_limit: float,
+                history: Optional[List[int]] = None, quiet_plies: int = 0):
+    """Exécutée dans un processus du pool : (coup, profondeur atteinte, nœuds)."""
+    bot = MinimaxBot(turn, depth=depth, search="pvs", time_limit=time_limit)
+    move = bot.choose_move_sequence(board, turn, history, quiet_plies)
+    return move, bot.last_depth, bot.nodes
+
+
+class Match:
+    """Une partie hébergée : Game + paramètres du bot + métriques."""
+
+    def __init__(self, game_id: int, human_color: str, depth: int, time_budget: float,
+                 variant: str = "classique"):
+        self.game_id = game_id
+        self.game = Game(rules=get_rules(variant))
+        self.human_color = human_color
+        self.bot_color = opponent(human_color)
+        self.depth = depth
+        self.time_left = time_budget
+        self.lock = asyncio.Lock()
+
+        # Métriques (secondes)
+        self.bot_moves = 0
+        self.search_time = 0.0
+        self.queue_time = 0.0
+        self.latencies: List[float] = []   # requête reçue → réponse prête
+        self.nodes = 0
+
+    def next_move_time(self) -> float:
+        t = self.time_left / MOVES_HORIZON
+        return max(MIN_MOVE_TIME, min(MAX_MOVE_TIME, t))
+
+    def state(self) -> dict:
+        g = self.game
+        return {
+            "game_id": self.game_id,
+            "board": board_rows(g.board),
+            "turn": g.turn,
+            "variant": g.rules.name,
+            "winner": g.winner(),
+            "human_color": self.human_color,
+            "time_left": round(self.time_left, 3),
+        }
+
+    def metrics(self) -> dict:
+        lat = self.latencies
+        return {
+            "game_id": self.game_id,
+            "bot_moves": self.bot_moves,
+            "nodes": self.nodes,
+            "search_time": round(self.search_time, 4),
+            "queue_time": round(self.queue_time, 4),
+            "latency_avg": round(sum(lat) / len(lat), 4) if lat else None,
+            "latency_max": round(max(lat), 4) if lat else None,
+            "latency_last": round(lat[-1], 4) if lat else None,
+        }
+
+
+def play_turn(game: Game, start: Tuple[int, int],
+              path: List[Tuple[int, int]]) -> Optional[Game]:
+    """
+    Joue un tour complet (départ + cases successives) sur une copie de la
+    partie, avec les règles de Game.select/move_selected. Retourne la copie
+    si le tour est légal et terminé, None sinon (la partie reçue est intacte).
+    """
+    trial = copy.deepcopy(game)
+    turn = trial.turn
+    if not trial.select(*start):
+        return None
+    for to in path:
+        if trial.turn != turn or not trial.move_selected(*to):
+            return None
+    if trial.turn == turn:
+        return None   # chaîne de captures inachevée
+    return trial
+
+
+class GameServer:
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.matches: Dict[int, Match] = {}
+        self.next_id = 1
+        self.jobs: "asyncio.Queue" = asyncio.Queue()
+        self.dispatchers: List[asyncio.Task] = []
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    # ── Cycle de vie ─────────────────────────────────────────────────
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.dispatchers = [asyncio.create_task(self._dispatch())
+                            for _ in range(self.workers)]
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for writer in self.clients.values():
+            writer.close()
+        if self.clients:
+            await asyncio.gather(*self.clients, return_exceptions=True)
+        for task in self.dispatchers:
+            task.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    # ── Recherches du bot ────────────────────────────────────────────
+    async def _dispatch(self) -> None:
+        """Un répartiteur par processus : prend le plus ancien coup en attente."""
+        loop = asyncio.get_running_loop()
+        while True:
+            match, fut, queued_at = await self.jobs.get()
+            try:
+                match.queue_time += time.perf_counter() - queued_at
+                t = match.next_move_time()
+                t0 = time.perf_counter()
+                result = await loop.run_in_executor(
+                    self.pool, search_move, match.game.board, match.game.turn,
+                    match.depth, t, match.game.history, match.game.quiet_plies)
+                elapsed = time.perf_counter() - t0
+                match.search_time += elapsed
+                match.time_left = max(0.0, match.time_left - elapsed)
+                if not fut.done():
+                    fut.set_result(result)
+            except Exception as exc:
+                if not fut.done():
+                    fut.set_exception(exc)
+            finally:
+                self.jobs.task_done()
+
+    async def _bot_play(self, match: Match) -> Optional[dict]:
+        g = match.game
+        if g.winner() is not None or g.turn != match.bot_color:
+            return None
+
+        fut = asyncio.get_running_loop().create_future()
+        await self.jobs.put((match, fut, time.perf_counter()))
+        move, depth, nodes = await fut
+        if move is None:
+            raise RuntimeError("le bot n'a trouvé aucun coup")
+
+        start, path = move
+        played = play_turn(g, start, path)
+        if played is None:
+            raise RuntimeError(f"coup du bot refusé : {move!r}")
+        match.game = played
+        match.bot_moves += 1
+        match.nodes += nodes
+        return {"start": list(start), "path": [list(p) for p in path], "depth": depth}
+
+    # ── Requêtes ─────────────────────────────────────────────────────
+    def _get_match(self, req: dict) -> Match:
+        try:
+            return self.matches[int(req["game_id"])]
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("game_id inconnu")
+
+    async def handle_request(self, req: dict) -> dict:
+        op = req.get("op")
+
+        if op == "new":
+            color = req.get("color", BLACK)
+            if color not in (WHITE, BLACK):
+                raise ValueError("color doit être WHITE ou BLACK")
+            depth = int(req.get("depth", DEFAULT_DEPTH))
+            if depth < 1:
+                raise ValueError("depth doit être au moins 1")
+            time_budget = float(req.get("time_budget", DEFAULT_TIME_BUDGET))
+            if not time_budget > 0:
+                raise ValueError("time_budget doit être positif")
+            match = Match(self.next_id, color, depth, time_budget,
+                          req.get("variant", "classique"))
+            self.next_id += 1
+            self.matches[match.game_id] = match
+            async with match.lock:
+                try:
+                    bot_move = await self._bot_play(match)
+                except Exception:
+                    # partie inutilisable (le bot doit jouer) : elle n'est pas créée
+                    del self.matches[match.game_id]
+                    raise
+            return {**match.state(), "bot_move": bot_move}
+
+        if op == "move":
+            match = self._get_match(req)
+            async with match.lock:
+                g = match.game
+                if g.winner() is not None:
+                    raise ValueError("partie terminée")
+                if g.turn != match.human_color:
+                    raise ValueError("ce n'est pas votre tour")
+                start = tuple(req["start"])
+                path = [tuple(p) for p in req["path"]]
+                played = play_turn(g, start, path)
+                if played is None:
+                    raise ValueError("coup illégal")
+                match.game = played
+                try:
+                    bot_move = await self._bot_play(match)
+                except Exception:
+                    match.game = g   # le coup humain est annulé, il peut être rejoué
+                    raise
+            return {**match.state(), "bot_move": bot_move}
+
+        if op == "state":
+            return self._get_match(req).state()
+
+        if op == "metrics":
+            if "game_id" in req:
+                return self._get_match(req).metrics()
+            return self.metrics()
+
+        if op == "close":
+            match = self._get_match(req)
+            del self.matches[match.game_id]
+            return match.metrics()
+
+        raise ValueError(f"op inconnue : {op!r}")
+
+    def metrics(self) -> dict:
+        lat = [x for m in self.matches.values() for x in m.latencies]
+        return {
+            "games": len(self.matches),
+            "queued": self.jobs.qsize(),
+            "workers": self.workers,
+            "latency_avg": round(sum(lat) / len(lat), 4) if lat else None,
+            "latency_max": round(max(lat), 4) if lat else None,
+        }
+
+    async def _answer(self, line: bytes, writer: asyncio.StreamWriter,
+                      write_lock: asyncio.Lock) -> None:
+        t0 = time.perf_counter()
+        req: dict = {}
+        try:
+            body = json.loads(line)
+            if not isinstance(body, dict):
+                raise ValueError("la requête doit être un objet JSON")
+            req = body
+            resp = {"ok": True, **await self.handle_request(req)}
+            if req.get("op") in ("new", "move"):
+                match = self.matches.get(resp["game_id"])
+                if match is not None:
+                    match.latencies.append(time.perf_counter() - t0)
+        except Exception as exc:
+            resp = {"ok": False, "error": str(exc)}
+
+        if "id" in req:
+            resp["id"] = req["id"]
+
+        async with write_lock:
+            writer.write(json.dumps(resp).encode() + b"\n")
+            await writer.drain()
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks = set()
+        me = asyncio.current_task()
+        self.clients[me] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._answer(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(me, None)
+            writer.close()
+
+
+async def _main(host: str, port: int, workers: Optional[int]) -> None:
+    server = GameServer(workers)
+    await server.start(host, port)
+    print(f"Serveur de dames sur {host}:{server.port} ({server.workers} processus)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Serveur de parties humain contre bot")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+    asyncio.run(_main(args.host, args.port, args.workers))
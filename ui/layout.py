@@ -0,0 +1,62 @@
+"""
+Géométrie de la fenêtre et du plateau, sans pygame : importable par les
+scripts et processus sans affichage. Les rectangles sont des tuples
+(x, y, largeur, hauteur), à passer à pygame.Rect(*rect) côté rendu.
+"""
+from typing import Optional, Tuple
+
+from game.board import ROWS, COLS
+
+Rect = Tuple[int, int, int, int]
+
+SQUARE_SIZE = 80
+HUD_HEIGHT  = 70
+BORDER      = 6
+
+WIDTH  = COLS * SQUARE_SIZE + BORDER * 2
+HEIGHT = ROWS * SQUARE_SIZE + HUD_HEIGHT + BORDER
+
+# Cadre + cases, sous le HUD
+BOARD_RECT: Rect = (0, HUD_HEIGHT, COLS * SQUARE_SIZE + BORDER * 2,
+                    ROWS * SQUARE_SIZE + BORDER)
+HUD_RECT: Rect = (0, 0, WIDTH, HUD_HEIGHT)
+RESET_RECT: Rect = (WIDTH - 118, (HUD_HEIGHT - 36) // 2, 106, 36)
+
+
+def square_rect(row: int, col: int) -> Rect:
+    return (BORDER + col * SQUARE_SIZE,
+            HUD_HEIGHT + BORDER + row * SQUARE_SIZE,
+            SQUARE_SIZE, SQUARE_SIZE)
+
+
+def cell_center_px(row: int, col: int) -> Tuple[int, int]:
+    x, y, w, h = square_rect(row, col)
+    return x + w // 2, y + h // 2
+
+
+def frame_size(n: int = ROWS) -> Tuple[int, int]:
+    """Cadre + cases d'un plateau n x n (taille de BOARD_RECT pour n = 8)."""
+    return n * SQUARE_SIZE + BORDER * 2, n * SQUARE_SIZE + BORDER
+
+
+def frame_square_rect(row: int, col: int) -> Rect:
+    """Case relative au coin du cadre (toute taille de plateau)."""
+    return (BORDER + col * SQUARE_SIZE, BORDER + row * SQUARE_SIZE,
+            SQUARE_SIZE, SQUARE_SIZE)
+
+
+def frame_cell_center(row: int, col: int) -> Tuple[int, int]:
+    x, y, w, h = frame_square_rect(row, col)
+    return x + w // 2, y + h // 2
+
+
+def square_at(pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """Case (row, col) sous le point (x, y) de la fenêtre, ou None."""
+    x, y = pos
+    if y < HUD_HEIGHT + BORDER:
+        return None
+    col = (x - BORDER) // SQUARE_SIZE
+    row = (y - HUD_HEIGHT - BORDER) // SQUARE_SIZE
+    if 0 <= row < ROWS and 0 <= col < COLS:
+        return row, col
+    return None
@@ -1,14 +1,12 @@
+import os
 import pygame
-from typing import Optional
-from game.piece import WHITE, BLACK
-
-ROWS, COLS  = 8, 8
-SQUARE_SIZE = 80
-HUD_HEIGHT  = 70
-BORDER      = 6
-
-WIDTH  = COLS * SQUARE_SIZE + BORDER * 2
-HEIGHT = ROWS * SQUARE_SIZE + HUD_HEIGHT + BORDER
+from typing import Dict, List, Optional, Tuple
+from game.board import ROWS, COLS
+from game.piece import WHITE, BLACK, DRAW
+from ui.layout import (SQUARE_SIZE, HUD_HEIGHT, WIDTH, HEIGHT,
+                       BOARD_RECT, HUD_RECT, RESET_RECT, square_rect,
+                       cell_center_px, frame_size, frame_square_rect,
+                       frame_cell_center)
 
 # Palette douce et lisible
 C_BG       = ( 14,  14,  18)
@@ -24,53 +22,86 @@ C_FLASH    = (255,  60,  60)
 
 PADDING = 9
 
+FLASH_ALPHA_STEP = 12   # niveaux d'alpha du flash capture (sprites en cache)
 
-def _board_rect(row: int, col: int) -> pygame.Rect:
-    return pygame.Rect(
-        BORDER + col * SQUARE_SIZE,
-        HUD_HEIGHT + BORDER + row * SQUARE_SIZE,
-        SQUARE_SIZE, SQUARE_SIZE,
-    )
+# Polices : attribut → (taille, gras)
+FONTS = {"font": (20, True), "sm_font": (16, False), "big_font": (62, True)}
 
 
-def cell_center_px(row: int, col: int):
-    r = _board_rect(row, col)
-    return r.centerx, r.centery
+def _board_rect(row: int, col: int) -> pygame.Rect:
+    return pygame.Rect(*square_rect(row, col))
 
 
 class Renderer:
-    def __init__(self, screen: pygame.Surface):
+    """
+    dirty=False : tout l'écran est redessiné à chaque frame (draw() retourne
+                  le rectangle de l'écran).
+    dirty=True  : seules les cases / zones qui ont changé depuis le dernier
+                  draw() sont redessinées, et draw() retourne leurs rectangles
+                  pour pygame.display.update(rects). Une frame sans changement
+                  ne dessine rien et retourne [].
+    """
+
+    def __init__(self, screen: pygame.Surface, dirty: bool = False):
         self.screen = screen
-        pygame.font.init()
-        self.font     = pygame.font.SysFont("Arial", 20, bold=True)
-        self.sm_font  = pygame.font.SysFont("Arial", 16)
-        self.big_font = pygame.font.SysFont("Arial", 62, bold=True)
-
-        self.reset_rect = pygame.Rect(
-            WIDTH - 118, (HUD_HEIGHT - 36) // 2, 106, 36)
-
-        self._cache: dict = {}   # (color_str, is_king) → Surface
+        self.dirty  = dirty
+        # Polices chargées au premier texte dessiné (voir _font) : SysFont
+        # parcourt les polices du système, inutile pour les miniatures
+        self._fonts: Dict[str, "pygame.font.Font"] = {}
+
+        self.reset_rect = pygame.Rect(*RESET_RECT)
+
+        # Atlas de sprites pré-rendus :
+        #   (color_str, is_king)        → pièce
+        #   ("marker", capture)         → point de déplacement / anneau de capture
+        #   ("flash", level)            → overlay de capture à alpha quantifié
+        #   ("text", font, text, color) → rendu de texte (HUD, overlay)
+        #   ("overlay",)                → voile de fin de partie
+        self._cache: dict = {}
+
+        # Fond + cadre + cases, pré-rendus une seule fois
+        self._static: Optional[pygame.Surface] = None
+        # Mode dirty : état affiché lors du dernier draw() (None = tout redessiner)
+        self._prev: Optional[dict] = None
+
+    @classmethod
+    def headless(cls) -> "Renderer":
+        """Renderer hors écran : dessine sur une Surface, sans fenêtre
+        (driver vidéo SDL « dummy »). Voir render_position()."""
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        return cls(pygame.Surface((WIDTH, HEIGHT)))
 
     def get_reset_rect(self):
         return self.reset_rect
 
-    # ── HUD ──────────────────────────────────────────────────────────
-    def draw_hud(self, game, thinking: bool = False) -> None:
-        pygame.draw.rect(self.screen, C_HUD_BG, (0, 0, WIDTH, HUD_HEIGHT))
-        pygame.draw.line(self.screen, C_HUD_LINE,
-                         (0, HUD_HEIGHT - 1), (WIDTH, HUD_HEIGHT - 1), 1)
+    def invalidate(self) -> None:
+        """Force un redessin complet au prochain draw() (mode dirty)."""
+        self._prev = None
 
-        # Compteur de pièces
+    # ── HUD ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _count_pieces(board) -> Tuple[int, int]:
         bc = wc = 0
-        for r in range(8):
-            for c in range(8):
-                p = game.board.grid[r][c]
+        for row in board.grid:
+            for p in row:
                 if p is None:
                     continue
                 if p.color == BLACK:
                     bc += 1
                 else:
                     wc += 1
+        return bc, wc
+
+    @staticmethod
+    def _thinking_dots() -> str:
+        return "." * ((pygame.time.get_ticks() // 400) % 4)
+
+    def draw_hud(self, game, thinking: bool = False) -> None:
+        pygame.draw.rect(self.screen, C_HUD_BG, HUD_RECT)
+        pygame.draw.line(self.screen, C_HUD_LINE,
+                         (0, HUD_HEIGHT - 1), (WIDTH, HUD_HEIGHT - 1), 1)
+
+        bc, wc = self._count_pieces(game.board)
 
         # Indicateur de tour : petit cercle coloré + texte
         dot_col = (235, 228, 215) if game.turn == WHITE else (40, 38, 35)
@@ -80,12 +111,12 @@ class Renderer:
         pygame.draw.circle(self.screen, dot_col, (20, mid_y), 10)
 
         label = "Blancs" if game.turn == WHITE else "Noirs"
-        t = self.font.render(f"{label}   {bc} ⬤ / {wc} ⬤", True, (205, 208, 220))
+        t = self._text("font", f"{label}   {bc} ⬤ / {wc} ⬤", (205, 208, 220))
         self.screen.blit(t, (42, mid_y - t.get_height() // 2))
 
         if thinking:
-            dots = "." * ((pygame.time.get_ticks() // 400) % 4)
-            bt = self.sm_font.render(f"Bot réfléchit{dots}", True, (110, 190, 255))
+            dots = self._thinking_dots()
+            bt = self._text("sm_font", f"Bot réfléchit{dots}", (110, 190, 255))
             self.screen.blit(bt, (42, mid_y + t.get_height() // 2 - 1))
 
         # Bouton Reset
@@ -93,26 +124,41 @@ class Renderer:
                          self.reset_rect, border_radius=7)
         pygame.draw.rect(self.screen, (80, 86, 122),
                          self.reset_rect, 2, border_radius=7)
-        rt = self.font.render("Reset", True, (200, 208, 232))
+        rt = self._text("font", "Reset", (200, 208, 232))
         self.screen.blit(rt, rt.get_rect(center=self.reset_rect.center))
 
     # ── Board ────────────────────────────────────────────────────────
-    def draw_board(self) -> None:
-        bw = COLS * SQUARE_SIZE + BORDER * 2
-        bh = ROWS * SQUARE_SIZE + BORDER
+    def _build_static(self) -> pygame.Surface:
+        """Fond, ombre, cadre et cases : tout ce qui ne change jamais."""
+        surf = pygame.Surface(self.screen.get_size(), 0, self.screen)
+        surf.fill(C_BG)
+
+        _, _, bw, bh = BOARD_RECT
 
         # Ombre
-        pygame.draw.rect(self.screen, (6, 3, 0),
+        pygame.draw.rect(surf, (6, 3, 0),
                          (10, HUD_HEIGHT + 10, bw, bh), border_radius=5)
         # Cadre
-        pygame.draw.rect(self.screen, C_FRAME,
+        pygame.draw.rect(surf, C_FRAME,
                          (0, HUD_HEIGHT, bw, bh), border_radius=4)
 
         # Cases — propres, sans fioritures
         for row in range(ROWS):
             for col in range(COLS):
                 color = C_DARK_SQ if (row + col) % 2 == 1 else C_LIGHT_SQ
-                pygame.draw.rect(self.screen, color, _board_rect(row, col))
+                pygame.draw.rect(surf, color, _board_rect(row, col))
+        return surf
+
+    def _get_static(self) -> pygame.Surface:
+        if self._static is None:
+            self._static = self._build_static()
+        return self._static
+
+    def draw_board(self) -> None:
+        self.screen.blit(self._get_static(), (0, 0))
+
+    def _restore_background(self, rect: pygame.Rect) -> None:
+        self.screen.blit(self._get_static(), rect.topleft, rect)
 
     # ── Pièce (propre et nette) ───────────────────────────────────────
     def _build(self, color_str: str, is_king: bool) -> pygame.Surface:
@@ -202,70 +248,313 @@ class Renderer:
         r, c = game.selected.row, game.selected.col
         pygame.draw.rect(self.screen, C_SEL, _board_rect(r, c), 3, border_radius=2)
 
-        SS = 3   # supersampling pour des cercles nets
         for (mr, mc), captured in game.valid_moves.items():
-            cx, cy = cell_center_px(mr, mc)
-            if captured:
-                # Anneau rouge antialiasé
-                rr = 11
-                pad = 5
-                size_hi = (rr + pad) * 2 * SS
-                s = pygame.Surface((size_hi, size_hi), pygame.SRCALPHA)
-                ch = size_hi // 2
-                pygame.draw.circle(s, C_CAP_DOT, (ch, ch), rr * SS, 3 * SS)
-                size_lo = (rr + pad) * 2
-                s_lo = pygame.transform.smoothscale(s, (size_lo, size_lo))
-                self.screen.blit(s_lo, (cx - size_lo // 2, cy - size_lo // 2))
-            else:
-                # Point blanc antialiasé
-                rr = 7
-                pad = 4
-                size_hi = (rr + pad) * 2 * SS
-                s = pygame.Surface((size_hi, size_hi), pygame.SRCALPHA)
-                ch = size_hi // 2
-                pygame.draw.circle(s, (*C_MOVE_DOT, 148), (ch, ch), rr * SS)
-                size_lo = (rr + pad) * 2
-                s_lo = pygame.transform.smoothscale(s, (size_lo, size_lo))
-                self.screen.blit(s_lo, (cx - size_lo // 2, cy - size_lo // 2))
+            self._draw_marker(mr, mc, bool(captured))
+
+    @staticmethod
+    def _build_marker(capture: bool) -> pygame.Surface:
+        SS = 3   # supersampling pour des cercles nets
+        if capture:
+            # Anneau rouge antialiasé
+            rr = 11
+            pad = 5
+            size_hi = (rr + pad) * 2 * SS
+            s = pygame.Surface((size_hi, size_hi), pygame.SRCALPHA)
+            ch = size_hi // 2
+            pygame.draw.circle(s, C_CAP_DOT, (ch, ch), rr * SS, 3 * SS)
+        else:
+            # Point blanc antialiasé
+            rr = 7
+            pad = 4
+            size_hi = (rr + pad) * 2 * SS
+            s = pygame.Surface((size_hi, size_hi), pygame.SRCALPHA)
+            ch = size_hi // 2
+            pygame.draw.circle(s, (*C_MOVE_DOT, 148), (ch, ch), rr * SS)
+        size_lo = (rr + pad) * 2
+        return pygame.transform.smoothscale(s, (size_lo, size_lo))
+
+    def _draw_marker(self, row: int, col: int, capture: bool) -> None:
+        key = ("marker", capture)
+        if key not in self._cache:
+            self._cache[key] = self._build_marker(capture)
+        s = self._cache[key]
+        cx, cy = cell_center_px(row, col)
+        self.screen.blit(s, (cx - s.get_width() // 2, cy - s.get_height() // 2))
 
     # ── Flash capture ─────────────────────────────────────────────────
     def draw_capture_flash(self, game) -> None:
         if game.capture_flash_frames <= 0:
             return
-        alpha = min(185, game.capture_flash_frames * 12)
+        alpha = self._flash_alpha(game)
         for (r, c) in game.last_captured_squares:
-            rect  = _board_rect(r, c)
-            flash = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+            self._draw_flash(r, c, alpha)
+
+    @staticmethod
+    def _flash_alpha(game) -> int:
+        """Alpha du flash, quantifié par paliers de FLASH_ALPHA_STEP."""
+        alpha = min(185, game.capture_flash_frames * 12)
+        return alpha - alpha % FLASH_ALPHA_STEP
+
+    def _draw_flash(self, row: int, col: int, alpha: int) -> None:
+        key = ("flash", alpha // FLASH_ALPHA_STEP)
+        if key not in self._cache:
+            flash = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
             flash.fill((*C_FLASH, alpha))
-            self.screen.blit(flash, rect.topleft)
+            self._cache[key] = flash
+        self.screen.blit(self._cache[key], _board_rect(row, col).topleft)
+
+    # ── Texte ─────────────────────────────────────────────────────────
+    def _font(self, name: str) -> "pygame.font.Font":
+        font = self._fonts.get(name)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            size, bold = FONTS[name]
+            font = self._fonts[name] = pygame.font.SysFont("Arial", size, bold=bold)
+        return font
+
+    def _text(self, font_name: str, text: str, color) -> pygame.Surface:
+        """Rendu de texte mis en cache par contenu (font_name : clé de FONTS)."""
+        key = ("text", font_name, text, color)
+        if key not in self._cache:
+            font = self._font(font_name)
+            self._cache[key] = font.render(text, True, color)
+        return self._cache[key]
 
     # ── Victoire ──────────────────────────────────────────────────────
     def draw_winner_overlay(self, winner: str) -> None:
-        ov = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        ov.fill((5, 6, 16, 172))
-        self.screen.blit(ov, (0, 0))
+        key = ("overlay",)
+        if key not in self._cache:
+            ov = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            ov.fill((5, 6, 16, 172))
+            self._cache[key] = ov
+        self.screen.blit(self._cache[key], (0, 0))
 
-        label = "Blancs" if winner == WHITE else "Noirs"
-        s = self.big_font.render(f"{label} gagnent !", True, (255, 242, 150))
+        if winner == DRAW:
+            title = "Match nul !"
+        else:
+            title = f"{'Blancs' if winner == WHITE else 'Noirs'} gagnent !"
+        s = self._text("big_font", title, (255, 242, 150))
         self.screen.blit(s, s.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 24)))
 
-        sm = self.font.render("Cliquez sur Reset pour rejouer", True, (185, 192, 215))
+        sm = self._text("font", "Cliquez sur Reset pour rejouer", (185, 192, 215))
         self.screen.blit(sm, sm.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 46)))
 
     # ── Draw ─────────────────────────────────────────────────────────
     def draw(self, game, winner: Optional[str],
-             thinking: bool = False, moving=None) -> None:
-        self.screen.fill(C_BG)
-        self.draw_board()
-        self.draw_hud(game, thinking)
-
+             thinking: bool = False, moving=None) -> List[pygame.Rect]:
+        """Dessine la frame et retourne les rectangles d'écran modifiés.
+        La fenêtre n'affiche que des plateaux 8x8 (ValueError sinon)."""
+        if len(game.board.grid) != ROWS:
+            raise ValueError(f"la fenêtre n'affiche que le plateau {ROWS}x{COLS}")
         mv_from  = moving.get("from")  if moving else None
         mv_pixel = moving.get("pixel") if moving else None
         mv_meta  = moving.get("meta")  if moving else None
 
-        self.draw_pieces(game.board, mv_from, mv_pixel, mv_meta)
+        if self.dirty:
+            return self._draw_dirty(game, winner, thinking,
+                                    mv_from, mv_pixel, mv_meta)
+        self._draw_full(game, winner, thinking, mv_from, mv_pixel, mv_meta)
+        return [self.screen.get_rect()]
+
+    def _draw_full(self, game, winner, thinking,
+                   mv_from, mv_pixel, mv_meta) -> None:
+        self.draw_board()
+        self.draw_hud(game, thinking)
+        self.draw_pieces(game.board, mv_from)
         self.draw_selection(game)
         self.draw_capture_flash(game)
 
+        # La pièce animée passe au-dessus des indicateurs
+        if mv_pixel and mv_meta:
+            self._draw_piece(mv_meta["color"], mv_meta["is_king"],
+                             int(mv_pixel[0]), int(mv_pixel[1]))
+
         if winner:
             self.draw_winner_overlay(winner)
+
+    # ── Rendu d'une position seule (miniatures) ──────────────────────
+    @staticmethod
+    def _frame_rect() -> pygame.Rect:
+        return pygame.Rect(*BOARD_RECT)
+
+    def _frame_surface(self, n: int) -> pygame.Surface:
+        """Cadre + cases d'un plateau n x n à l'échelle de la fenêtre
+        (celui de la fenêtre pour 8x8, dessiné de la même façon sinon)."""
+        if n == ROWS:
+            return self._get_static().subsurface(self._frame_rect())
+        bw, bh = frame_size(n)
+        surf = pygame.Surface((bw, bh), 0, self.screen)
+        surf.fill(C_BG)
+        pygame.draw.rect(surf, (6, 3, 0), (10, 10, bw, bh), border_radius=5)
+        pygame.draw.rect(surf, C_FRAME, (0, 0, bw, bh), border_radius=4)
+        for row in range(n):
+            for col in range(n):
+                color = C_DARK_SQ if (row + col) % 2 == 1 else C_LIGHT_SQ
+                pygame.draw.rect(surf, color, frame_square_rect(row, col))
+        return surf
+
+    def _thumb_sprites(self, size: Tuple[int, int], n: int = ROWS) -> dict:
+        """Fond d'un plateau n x n + sprites des pièces mis à l'échelle de
+        `size`, et surface cible réutilisée : pré-rendus une fois par taille."""
+        key = ("thumb", size, n)
+        if key not in self._cache:
+            fw, fh = frame_size(n)
+            bg = pygame.transform.smoothscale(self._frame_surface(n), size)
+            kx, ky = size[0] / fw, size[1] / fh
+            pieces = {}
+            for color in (WHITE, BLACK):
+                for is_king in (False, True):
+                    spr = self._get(color, is_king)
+                    w = max(1, round(spr.get_width() * kx))
+                    h = max(1, round(spr.get_height() * ky))
+                    pieces[(color, is_king)] = pygame.transform.smoothscale(spr, (w, h))
+            centers = {}
+            for r in range(n):
+                for c in range(n):
+                    cx, cy = frame_cell_center(r, c)
+                    centers[(r, c)] = (cx * kx, cy * ky)
+            self._cache[key] = {"bg": bg, "pieces": pieces, "centers": centers,
+                                "target": pygame.Surface(size, 0, bg)}
+        return self._cache[key]
+
+    def render_position(self, board, size: Optional[Tuple[int, int]] = None
+                        ) -> pygame.Surface:
+        """
+        Dessine le plateau seul (cadre + cases + pièces), à sa taille réelle
+        ou directement à la taille `size` (fond et sprites pré-mis à l'échelle).
+        Toute taille de plateau (variantes de game/rules.py). La surface
+        retournée est réutilisée au rendu suivant : la copier ou
+        l'enregistrer avant.
+        """
+        n = len(board.grid)
+        if size is None and n != ROWS:
+            size = frame_size(n)
+        if size is None:
+            frame = self._frame_rect()
+            self.screen.blit(self._get_static(), frame.topleft, frame)
+            self.draw_pieces(board)
+            self._prev = None
+            return self.screen.subsurface(frame)
+
+        t = self._thumb_sprites(size, n)
+        target, pieces, centers = t["target"], t["pieces"], t["centers"]
+        target.blit(t["bg"], (0, 0))
+        for r in range(n):
+            for c in range(n):
+                p = board.grid[r][c]
+                if p is None:
+                    continue
+                spr = pieces[(p.color, p.is_king)]
+                cx, cy = centers[(r, c)]
+                target.blit(spr, (int(cx - spr.get_width() / 2),
+                                  int(cy - spr.get_height() / 2)))
+        return target
+
+    # ── Mode dirty ────────────────────────────────────────────────────
+    def _square_states(self, game, mv_from) -> Dict[Tuple[int, int], tuple]:
+        """Tout ce qui est dessiné dans chaque case : (pièce, sélection,
+        marqueur, alpha du flash). Une case est redessinée quand son état change."""
+        markers = {}
+        if game.selected is not None:
+            markers = {pos: ("ring" if caps else "dot")
+                       for pos, caps in game.valid_moves.items()}
+            selected = (game.selected.row, game.selected.col)
+        else:
+            selected = None
+
+        flash = {}
+        if game.capture_flash_frames > 0:
+            alpha = self._flash_alpha(game)
+            flash = {pos: alpha for pos in game.last_captured_squares}
+
+        states = {}
+        for r in range(ROWS):
+            for c in range(COLS):
+                p = game.board.grid[r][c]
+                piece = None
+                if p is not None and (r, c) != mv_from:
+                    piece = (p.color, p.is_king)
+                states[(r, c)] = (piece, (r, c) == selected,
+                                  markers.get((r, c)), flash.get((r, c), 0))
+        return states
+
+    def _hud_state(self, game, thinking: bool) -> tuple:
+        dots = self._thinking_dots() if thinking else None
+        return (game.turn, self._count_pieces(game.board), dots)
+
+    def _moving_rect(self, mv_pixel, mv_meta) -> Optional[pygame.Rect]:
+        if not (mv_pixel and mv_meta):
+            return None
+        s = self._get(mv_meta["color"], mv_meta["is_king"])
+        rect = s.get_rect()
+        rect.center = (int(mv_pixel[0]), int(mv_pixel[1]))
+        return rect
+
+    @staticmethod
+    def _squares_under(rect: pygame.Rect) -> List[Tuple[int, int]]:
+        squares = []
+        for r in range(ROWS):
+            for c in range(COLS):
+                if _board_rect(r, c).colliderect(rect):
+                    squares.append((r, c))
+        return squares
+
+    def _draw_square(self, row: int, col: int, state: tuple) -> pygame.Rect:
+        piece, selected, marker, flash = state
+        rect = _board_rect(row, col)
+        self._restore_background(rect)
+        if piece is not None:
+            cx, cy = rect.center
+            self._draw_piece(piece[0], piece[1], cx, cy)
+        if selected:
+            pygame.draw.rect(self.screen, C_SEL, rect, 3, border_radius=2)
+        if marker is not None:
+            self._draw_marker(row, col, marker == "ring")
+        if flash:
+            self._draw_flash(row, col, flash)
+        return rect
+
+    def _draw_dirty(self, game, winner, thinking,
+                    mv_from, mv_pixel, mv_meta) -> List[pygame.Rect]:
+        squares = self._square_states(game, mv_from)
+        hud     = self._hud_state(game, thinking)
+        mv_rect = self._moving_rect(mv_pixel, mv_meta)
+
+        prev = self._prev
+        self._prev = {"squares": squares, "hud": hud,
+                      "moving": mv_rect, "winner": winner}
+
+        # Premier dessin, ou overlay de victoire (semi-transparent sur tout
+        # l'écran) : redessin complet quand quelque chose change.
+        if prev is None or winner != prev["winner"] or (
+                winner and (squares != prev["squares"] or hud != prev["hud"]
+                            or mv_rect != prev["moving"])):
+            self._draw_full(game, winner, thinking, mv_from, mv_pixel, mv_meta)
+            return [self.screen.get_rect()]
+
+        dirty = {pos for pos, st in squares.items() if st != prev["squares"][pos]}
+        if prev["moving"] is not None and prev["moving"] != mv_rect:
+            dirty.update(self._squares_under(prev["moving"]))
+
+        # La pièce animée est redessinée (avec toutes les cases qu'elle
+        # recouvre) dès qu'elle bouge ou qu'une case sous elle change.
+        redraw_moving = False
+        if mv_rect is not None:
+            under = self._squares_under(mv_rect)
+            if mv_rect != prev["moving"] or dirty.intersection(under):
+                dirty.update(under)
+                redraw_moving = True
+
+        rects = [self._draw_square(r, c, squares[(r, c)]) for r, c in dirty]
+
+        if redraw_moving:
+            self._draw_piece(mv_meta["color"], mv_meta["is_king"],
+                             mv_rect.centerx, mv_rect.centery)
+
+        if hud != prev["hud"]:
+            self._restore_background(pygame.Rect(*HUD_RECT))
+            self.draw_hud(game, thinking)
+            rects.append(pygame.Rect(*HUD_RECT))
+
+        return rects
@@ -0,0 +1,72 @@
+"""
+Rendu de positions en PNG par lots, sans fenêtre (revues de parties,
+aperçus de jeux de données).
+
+    from ui.thumbnails import render_positions
+    paths = render_positions(boards, "out/", size=(160, 160), workers=4)
+
+Chaque processus garde un seul Renderer headless : fond du plateau et
+sprites des pièces sont pré-rendus (et pré-mis à l'échelle) une fois par
+taille de plateau, chaque position ne coûte qu'un blit par pièce. Les
+plateaux de toutes les variantes (8x8, 10x10…) sont rendus en entier. L'encodage PNG domine
+ensuite : workers > 0 le répartit sur plusieurs processus, et ext="bmp"
+l'évite quand la compression n'est pas nécessaire.
+
+pygame n'est importé qu'au premier rendu : un processus qui importe ce
+module sans rien dessiner (ou un pool qui démarre) n'en paie pas le coût.
+"""
+import os
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pygame
+    from ui.renderer import Renderer
+
+Size = Tuple[int, int]
+
+_renderer: Optional["Renderer"] = None   # un par processus
+
+
+def _get_renderer() -> "Renderer":
+    global _renderer
+    if _renderer is None:
+        from ui.renderer import Renderer
+        _renderer = Renderer.headless()
+    return _renderer
+
+
+def render_thumbnail(board, size: Optional[Size] = None) -> "pygame.Surface":
+    """Copie de la position rendue (taille réelle du plateau ou `size`)."""
+    return _get_renderer().render_position(board, size).copy()
+
+
+def save_thumbnail(board, path: str, size: Optional[Size] = None) -> str:
+    """Enregistre la position ; le format suit l'extension (png, bmp, tga…)."""
+    import pygame
+    pygame.image.save(_get_renderer().render_position(board, size), path)
+    return path
+
+
+def _save_job(job) -> str:
+    board, path, size = job
+    return save_thumbnail(board, path, size)
+
+
+def render_positions(boards: Iterable, out_dir: str, size: Optional[Size] = None,
+                     workers: int = 0, prefix: str = "pos", ext: str = "png",
+                     chunksize: int = 64) -> List[str]:
+    """
+    Enregistre chaque plateau de `boards` dans out_dir
+    ({prefix}_{index:06d}.{ext}) et retourne les chemins, dans l'ordre.
+    workers > 0 : rendu réparti sur un pool de processus.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = ((board, os.path.join(out_dir, f"{prefix}_{i:06d}.{ext}"), size)
+            for i, board in enumerate(boards))
+
+    if workers <= 0:
+        return [_save_job(job) for job in jobs]
+
+    with Pool(workers) as pool:
+        return list(pool.imap(_save_job, jobs, chunksize=chunksize))